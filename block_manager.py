@@ -13,6 +13,9 @@ class BlockManager:
         self.sprites = {}
         self.sprite_paths = {}
         self.custom_blocks = []
+
+        # Bumped whenever block definitions change, used to key search-filter caches
+        self.blocks_version = 0
         
         # Initialize default blocks
         self.init_default_blocks()
@@ -334,7 +337,8 @@ class BlockManager:
             
             self.sprites[block_id] = sprite
             self.sprite_paths[block_id] = sprite_path
-            
+            self.blocks_version += 1
+
             print(f"Loaded sprite: {block_id} from {sprite_path}")
             return True
             
@@ -407,7 +411,8 @@ class BlockManager:
         
         # Sort custom blocks by name
         self.blocks['custom'].sort(key=lambda x: x['name'])
-        
+        self.blocks_version += 1
+
         print(f"Created {len(self.blocks['custom'])} custom blocks")
     
     def create_friendly_name(self, block_id):
@@ -469,6 +474,7 @@ class BlockManager:
             
             # Add to custom category
             self.blocks['custom'].append(block_def)
+            self.blocks_version += 1
             return True
         
         return False
@@ -1,7 +1,28 @@
+import os
 import pygame
 import math
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from constants import Layer
 
+# Optional GPU path: pygame's SDL2 Texture API batches chunk draws on the GPU
+# and makes scaling free. Only used when a Renderer is attached to the manager.
+try:
+    from pygame._sdl2.video import Texture
+    _HAS_SDL2_VIDEO = True
+except ImportError:
+    Texture = None
+    _HAS_SDL2_VIDEO = False
+
+# Optional NumPy for vectorized culling sweeps; everything falls back to the
+# scalar loops when it isn't installed.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = logging.getLogger(__name__)
+
 
 class SpriteCache:
     """Cache for scaled sprites to avoid repeated scaling operations"""
@@ -65,6 +86,8 @@ class OptimizedChunk:
     def __init__(self, x, y, size):
         self.x = x  # Chunk grid position X
         self.y = y  # Chunk grid position Y
+        self.id = (x, y)  # Stable identity for cache keys
+        self.version = 0  # Bumped on every re-render for cache invalidation
         self.size = size  # Chunk size in tiles
         self.dirty = True  # Whether the chunk needs re-rendering
         self.surface = None  # Pre-rendered surface
@@ -79,6 +102,10 @@ class OptimizedChunk:
         # Layer surfaces for optimized compositing
         self.layer_surfaces = {}
         self.layer_dirty = {Layer.BACKGROUND: True, Layer.MIDGROUND: True}
+
+        # GPU copy of the surface for the optional SDL2 Renderer path
+        self.texture = None
+        self.texture_version = -1  # Version the texture was last uploaded at
     
     def needs_rerender(self, world_planner, base_tile_size):
         """Check if chunk needs re-rendering based on changes"""
@@ -175,34 +202,37 @@ class OptimizedChunk:
         # Calculate surface size (includes border for seamless sprite rendering)
         expanded_size = self.size + 2 * self.border
         chunk_pixel_size = expanded_size * base_tile_size
-        
-        # Create optimized surface
-        if self.surface is None or self.surface.get_size() != (chunk_pixel_size, chunk_pixel_size):
-            self.surface = pygame.Surface((chunk_pixel_size, chunk_pixel_size), pygame.SRCALPHA)
-            self.surface = self.surface.convert_alpha()
-        
-        # Clear surface efficiently
-        self.surface.fill((0, 0, 0, 0))
-        
+
+        # Rasterize into a scratch surface and publish it by reference swap at
+        # the end. The render pool runs this concurrently with the main
+        # thread's blits, so self.surface must never be mutated in place: a
+        # chunk that overruns the frame budget keeps showing its previous
+        # content until the new surface is fully drawn.
+        surface = pygame.Surface((chunk_pixel_size, chunk_pixel_size), pygame.SRCALPHA)
+        surface = surface.convert_alpha()
+
         # Check for world background
         has_world_background = world_planner.background_manager.get_current_background() is not None
-        
+
         if not has_world_background:
-            self.surface.fill((17, 17, 17))
-        
+            surface.fill((17, 17, 17))
+
         # FIXED: Draw grid ONLY in main area (will be drawn by main area extraction)
         if world_planner.show_grid:
-            self.draw_grid_in_main_area_only(world_planner, base_tile_size, has_world_background)
-        
+            self.draw_grid_in_main_area_only(world_planner, base_tile_size, has_world_background, surface)
+
         # Render sprites with full border area for seamless rendering
         for layer_enum in [Layer.BACKGROUND, Layer.MIDGROUND]:
-            self.render_layer(world_planner, layer_enum, base_tile_size, self.surface)
-        
-        # Update state AFTER successful render
+            self.render_layer(world_planner, layer_enum, base_tile_size, surface)
+
+        # Publish the finished surface, then update state AFTER successful render
+        self.surface = surface
         self.dirty = False
         self.last_zoom = current_zoom
         self.last_tile_size = base_tile_size
         self.blocks_hash = current_hash
+        # Surface content changed - invalidate any cached scaled versions
+        self.version += 1
     
     def force_visual_update(self, world_planner, base_tile_size):
         """FIXED: Force immediate visual update with proper state management"""
@@ -276,7 +306,7 @@ class OptimizedChunk:
                 if x_end > x_start:
                     pygame.draw.line(self.surface, grid_color, (x_start, local_y), (x_end, local_y), 1)
                     
-    def draw_grid_in_main_area_only(self, world_planner, base_tile_size, has_world_background):
+    def draw_grid_in_main_area_only(self, world_planner, base_tile_size, has_world_background, surface):
         """Draw grid only in the main chunk area AND within world boundaries"""
         if has_world_background:
             grid_color = (70, 70, 70)
@@ -315,7 +345,7 @@ class OptimizedChunk:
             y_end = border_pixels + min(self.size, actual_end_tile_y - chunk_start_tile_y) * base_tile_size
             
             if y_end > y_start:
-                pygame.draw.line(self.surface, grid_color, (x_pos, y_start), (x_pos, y_end), 1)
+                pygame.draw.line(surface, grid_color, (x_pos, y_start), (x_pos, y_end), 1)
         
         # Horizontal lines - only draw where tiles actually exist in the world
         for world_tile_y in range(actual_start_tile_y, actual_end_tile_y + 1):
@@ -328,31 +358,125 @@ class OptimizedChunk:
             x_end = border_pixels + min(self.size, actual_end_tile_x - chunk_start_tile_x) * base_tile_size
             
             if x_end > x_start:
-                pygame.draw.line(self.surface, grid_color, (x_start, y_pos), (x_end, y_pos), 1)
+                pygame.draw.line(surface, grid_color, (x_start, y_pos), (x_end, y_pos), 1)
+
+
+class ChunkQuadTree:
+    """PR quadtree over chunk grid coordinates for viewport range queries"""
+
+    MAX_LEAF_SIZE = 8
+
+    def __init__(self, min_x, min_y, max_x, max_y):
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = max_x
+        self.max_y = max_y
+        self.keys = []
+        self.children = None
+
+    def insert(self, key):
+        """Insert a chunk key (cx, cy); duplicates are ignored"""
+        cx, cy = key
+        if not (self.min_x <= cx <= self.max_x and self.min_y <= cy <= self.max_y):
+            return
+        if self.children is None:
+            if key in self.keys:
+                return
+            self.keys.append(key)
+            # Split once the leaf fills up and can still subdivide
+            if len(self.keys) > self.MAX_LEAF_SIZE and self.max_x > self.min_x and self.max_y > self.min_y:
+                self._split()
+            return
+        for child in self.children:
+            child.insert(key)
+
+    def _split(self):
+        mid_x = (self.min_x + self.max_x) // 2
+        mid_y = (self.min_y + self.max_y) // 2
+        self.children = [
+            ChunkQuadTree(self.min_x, self.min_y, mid_x, mid_y),
+            ChunkQuadTree(mid_x + 1, self.min_y, self.max_x, mid_y),
+            ChunkQuadTree(self.min_x, mid_y + 1, mid_x, self.max_y),
+            ChunkQuadTree(mid_x + 1, mid_y + 1, self.max_x, self.max_y),
+        ]
+        keys = self.keys
+        self.keys = []
+        for key in keys:
+            for child in self.children:
+                child.insert(key)
+
+    def query(self, min_x, min_y, max_x, max_y, out=None):
+        """Collect chunk keys inside the inclusive (min_x..max_x, min_y..max_y) range"""
+        if out is None:
+            out = []
+        if min_x > self.max_x or max_x < self.min_x or min_y > self.max_y or max_y < self.min_y:
+            return out
+        if self.children is None:
+            for key in self.keys:
+                if min_x <= key[0] <= max_x and min_y <= key[1] <= max_y:
+                    out.append(key)
+            return out
+        for child in self.children:
+            child.query(min_x, min_y, max_x, max_y, out)
+        return out
 
 
 class OptimizedChunkManager:
     """Optimized chunk manager with better performance"""
-    
+
     def __init__(self, world_planner, chunk_size=16):
         self.world_planner = world_planner
         self.chunk_size = chunk_size
+        # Bit-shift replaces // in tile->chunk math when chunk_size is a power of two
+        self._chunk_size_shift = chunk_size.bit_length() - 1 if chunk_size & (chunk_size - 1) == 0 else None
         self.chunks = {}
         self.cached_zoom = None
         self.max_chunks_per_frame = 3  # Reduced for better frame rate
+
+        # Shadow spatial index over created chunks. The rectangular grid scan in
+        # get_visible_chunks_optimized stays the fast path for normal views; the
+        # tree takes over when a zoomed-out view would visit too many grid cells.
+        self._chunk_index = ChunkQuadTree(
+            0, 0,
+            (world_planner.world_width - 1) // chunk_size,
+            (world_planner.world_height - 1) // chunk_size
+        )
+        self.quadtree_scan_threshold = 4096  # Grid cells before switching to tree query
+
+        # SoA mirrors of chunk grid positions for the vectorized culling sweep.
+        # Chunk positions are immutable, so the arrays only rebuild when the
+        # set of created chunks changes.
+        self._soa_keys = []
+        self._soa_x = None
+        self._soa_y = None
+        self._soa_dirty = True
         
         # Performance optimizations
         self.sprite_cache = SpriteCache(max_cache_size=2000)
         self.visible_chunks_cache = None
         self.last_camera_pos = None
         self.last_viewport_size = None
+
+        # Chunks queued for immediate rendering (brush operations)
+        self.immediate_render_chunks = set()
+
+        # Worker pool for parallel chunk rasterization - surface drawing runs
+        # in SDL C code and releases the GIL, so threads overlap well
+        self.render_pool = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+        self.render_frame_budget = 0.012  # Seconds to wait for immediate renders per frame
+        self._pending_renders = {}  # chunk_key -> in-flight Future
         
         # Frustum culling bounds
         self.viewport_bounds = None
+        self._cull_bounds = None  # (left, right, top, bottom) snapshot, one per frame
         
         # Background surface cache
         self.background_surface_cache = {}
         self.last_background_id = None
+
+        # Optional pygame._sdl2 Renderer. When set (and SDL2 video is available)
+        # chunk draws go through GPU textures instead of software blits.
+        self.renderer = None
     
     def get_chunk_key(self, tile_x, tile_y):
         """Convert tile coordinates to chunk key"""
@@ -365,6 +489,8 @@ class OptimizedChunkManager:
         key = (chunk_x, chunk_y)
         if key not in self.chunks:
             self.chunks[key] = OptimizedChunk(chunk_x, chunk_y, self.chunk_size)
+            self._chunk_index.insert(key)
+            self._soa_dirty = True
         return self.chunks[key]
     
     def invalidate_chunk(self, tile_x, tile_y):
@@ -374,9 +500,8 @@ class OptimizedChunkManager:
         if key in self.chunks:
             self.chunks[key].dirty = True
         else:
-            chunk_x, chunk_y = key
-            self.chunks[key] = OptimizedChunk(chunk_x, chunk_y, self.chunk_size)
-            self.chunks[key].dirty = True
+            chunk = self.get_or_create_chunk(key[0], key[1])
+            chunk.dirty = True
         
         # Invalidate neighboring chunks for sprites that might extend across boundaries
         chunk_x, chunk_y = key
@@ -389,6 +514,44 @@ class OptimizedChunkManager:
                 if neighbor_key in self.chunks:
                     self.chunks[neighbor_key].dirty = True
     
+    def invalidate_region(self, x0, y0, x1, y1):
+        """Mark every chunk overlapping a tile-space rectangle dirty in one pass"""
+        start_cx, start_cy = self.get_chunk_key(x0, y0)
+        end_cx, end_cy = self.get_chunk_key(x1, y1)
+
+        for cy in range(start_cy, end_cy + 1):
+            for cx in range(start_cx, end_cx + 1):
+                self.get_or_create_chunk(cx, cy).dirty = True
+
+        # One ring of neighbors for sprites that extend across chunk borders -
+        # only touched if they already exist, matching invalidate_chunk
+        for cy in range(start_cy - 1, end_cy + 2):
+            for cx in range(start_cx - 1, end_cx + 2):
+                if start_cx <= cx <= end_cx and start_cy <= cy <= end_cy:
+                    continue
+                chunk = self.chunks.get((cx, cy))
+                if chunk is not None:
+                    chunk.dirty = True
+
+    def invalidate_chunk_keys(self, chunk_keys):
+        """Mark a pre-deduplicated set of chunk keys dirty in one pass"""
+        for chunk_x, chunk_y in chunk_keys:
+            chunk = self.get_or_create_chunk(chunk_x, chunk_y)
+            chunk.dirty = True
+            chunk.blocks_hash = None
+
+        # One ring of neighbors for sprites that extend across chunk borders -
+        # only touched if they already exist, matching invalidate_chunk
+        for chunk_x, chunk_y in chunk_keys:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    neighbor_key = (chunk_x + dx, chunk_y + dy)
+                    if neighbor_key in chunk_keys:
+                        continue
+                    chunk = self.chunks.get(neighbor_key)
+                    if chunk is not None:
+                        chunk.dirty = True
+
     def invalidate_all_chunks(self):
         """Mark all chunks as dirty and clear caches with force"""
         for chunk in self.chunks.values():
@@ -401,6 +564,16 @@ class OptimizedChunkManager:
         self.sprite_cache.clear()
         self.visible_chunks_cache = None
         self.background_surface_cache.clear()
+
+        # Rebuild the spatial index - world dimensions may have changed on load
+        self._chunk_index = ChunkQuadTree(
+            0, 0,
+            (self.world_planner.world_width - 1) // self.chunk_size,
+            (self.world_planner.world_height - 1) // self.chunk_size
+        )
+        for key in self.chunks:
+            self._chunk_index.insert(key)
+        self._soa_dirty = True
     
     def force_render_visible_chunks(self, camera_x, camera_y, effective_tile_size):
         """Force immediate rendering of visible chunks for smooth interaction"""
@@ -424,72 +597,62 @@ class OptimizedChunkManager:
             return
         
         base_tile_size = self.world_planner.tile_size
+        chunk_size = self.chunk_size
         updated_chunks = set()
-        
-        # Step 1: Update all affected chunks and invalidate their cache entries
-        for x, y in affected_positions:
-            chunk_key = self.get_chunk_key(x, y)
-            if chunk_key not in updated_chunks:
-                chunk = self.get_or_create_chunk(chunk_key[0], chunk_key[1])
-                
-                # Force visual update
-                chunk.force_visual_update(self.world_planner, base_tile_size)
-                
-                # CRITICAL: Invalidate all cached scaled versions of this chunk
-                self.invalidate_chunk_cache_entries(chunk)
-                
-                updated_chunks.add(chunk_key)
-                
-                # Also update immediate neighbors
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        neighbor_key = (chunk_key[0] + dx, chunk_key[1] + dy)
-                        if neighbor_key not in updated_chunks:
-                            neighbor_chunk = self.get_or_create_chunk(neighbor_key[0], neighbor_key[1])
-                            neighbor_chunk.force_visual_update(self.world_planner, base_tile_size)
-                            self.invalidate_chunk_cache_entries(neighbor_chunk)
-                            updated_chunks.add(neighbor_key)
-        
+
+        # Step 1: Deduplicate positions into chunk keys before touching any
+        # chunk. A brush stroke hands in many tiles per chunk, and updating a
+        # chunk more than once per call is pure redundant work.
+        target_keys = {(x // chunk_size, y // chunk_size) for x, y in affected_positions}
+
+        for target_x, target_y in target_keys:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    chunk_key = (target_x + dx, target_y + dy)
+                    if chunk_key in updated_chunks:
+                        continue
+                    chunk = self.get_or_create_chunk(chunk_key[0], chunk_key[1])
+
+                    # Force visual update
+                    chunk.force_visual_update(self.world_planner, base_tile_size)
+
+                    # CRITICAL: Invalidate all cached scaled versions of this chunk
+                    self.invalidate_chunk_cache_entries(chunk)
+
+                    updated_chunks.add(chunk_key)
+
         # Step 2: Mark for immediate rendering
         self.mark_chunks_for_immediate_render(affected_positions)
-    
+
     def mark_chunks_for_immediate_render(self, affected_positions):
         """Mark chunks as requiring immediate rendering in the next frame"""
-        if not hasattr(self, 'immediate_render_chunks'):
-            self.immediate_render_chunks = set()
-        
-        for x, y in affected_positions:
-            chunk_key = self.get_chunk_key(x, y)
+        chunk_size = self.chunk_size
+        target_keys = {(x // chunk_size, y // chunk_size) for x, y in affected_positions}
+
+        # Expand one neighbor ring in chunk space, once per unique chunk,
+        # instead of re-marking the same 3x3 block for every position
+        pending_keys = set()
+        for target_x, target_y in target_keys:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    pending_keys.add((target_x + dx, target_y + dy))
+
+        for chunk_key in pending_keys:
             chunk = self.get_or_create_chunk(chunk_key[0], chunk_key[1])
             chunk.dirty = True
             chunk.blocks_hash = None  # Force content check
             self.immediate_render_chunks.add(chunk_key)
-            
-            # Also mark immediate neighbors
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    neighbor_key = (chunk_key[0] + dx, chunk_key[1] + dy)
-                    neighbor_chunk = self.get_or_create_chunk(neighbor_key[0], neighbor_key[1])
-                    neighbor_chunk.dirty = True
-                    neighbor_chunk.blocks_hash = None
-                    self.immediate_render_chunks.add(neighbor_key)
     
     def invalidate_chunk_cache_entries(self, chunk):
         """Invalidate all cached scaled versions of a chunk surface"""
         if chunk.surface is None:
             return
-        
-        chunk_surface_id = id(chunk.surface)
-        
-        # Remove all cache entries for this chunk surface at any scale
+
+        # Remove all cache entries for this chunk at any scale (old versions included)
         keys_to_remove = []
         for cache_key in self.sprite_cache.cache.keys():
             if isinstance(cache_key, tuple) and len(cache_key) >= 2:
-                if cache_key[0] == chunk_surface_id:
+                if cache_key[0] == chunk.id:
                     keys_to_remove.append(cache_key)
         
         for key in keys_to_remove:
@@ -510,7 +673,9 @@ class OptimizedChunkManager:
             surface.blit(chunk.surface, (screen_x, screen_y))
         else:
             # Need to scale the chunk surface
-            cache_key = (id(chunk.surface), chunk_pixel_size)
+            # Keyed by chunk identity + version, not id(surface) - a reallocated
+            # surface can reuse the same memory address and give a stale hit
+            cache_key = (chunk.id, chunk.version, chunk_pixel_size)
             
             # Check if we have a cached scaled version
             if cache_key in self.sprite_cache.cache:
@@ -552,50 +717,54 @@ class OptimizedChunkManager:
     def draw_chunk_main_area_only(self, surface, chunk, screen_x, screen_y, chunk_pixel_size, 
                                 base_tile_size, effective_tile_size):
         """Draw chunk with extended sprite preservation"""
-        
-        border_pixels = chunk.border * base_tile_size
+        # Hoist per-chunk attribute reads - this runs for every visible chunk
+        chunk_surface = chunk.surface
+        chunk_border = chunk.border
+        sprite_cache = self.sprite_cache
+
+        border_pixels = chunk_border * base_tile_size
         main_area_size = chunk.size * base_tile_size
-        
+
         # Calculate the area to extract - include full border for now
         src_x = 0  # Include left border
-        src_y = 0  # Include top border  
-        src_width = chunk.surface.get_width()  # Full width including borders
-        src_height = chunk.surface.get_height()  # Full height including borders
-        
+        src_y = 0  # Include top border
+        src_width = chunk_surface.get_width()  # Full width including borders
+        src_height = chunk_surface.get_height()  # Full height including borders
+
         # Calculate where to draw it on screen (accounting for borders)
         draw_x = screen_x - border_pixels
         draw_y = screen_y - border_pixels
-        
+
         try:
             if effective_tile_size == base_tile_size:
                 # No scaling needed - draw full chunk surface
-                surface.blit(chunk.surface, (draw_x, draw_y))
+                surface.blit(chunk_surface, (draw_x, draw_y))
             else:
                 # Scale the full chunk surface
-                cache_key = (id(chunk.surface), "full_chunk", chunk_pixel_size)
-                
-                if cache_key in self.sprite_cache.cache:
-                    scaled_surface = self.sprite_cache.cache[cache_key]
+                cache_key = (chunk.id, chunk.version, "full_chunk", chunk_pixel_size)
+
+                if cache_key in sprite_cache.cache:
+                    scaled_surface = sprite_cache.cache[cache_key]
                 else:
                     # Calculate scaled size for full chunk including borders
-                    expanded_size = self.chunk_size + 2 * chunk.border
-                    full_scaled_size = int(expanded_size * effective_tile_size)
-                    
-                    scaled_surface = pygame.transform.scale(chunk.surface, (full_scaled_size, full_scaled_size))
+                    expanded_size = self.chunk_size + 2 * chunk_border
+                    full_scaled_size = expanded_size * effective_tile_size
+
+                    scaled_surface = pygame.transform.scale(chunk_surface, (full_scaled_size, full_scaled_size))
                     scaled_surface = scaled_surface.convert_alpha()
-                    
+
                     # Cache it
-                    self.sprite_cache.cache[cache_key] = scaled_surface
-                    self.sprite_cache.access_order.append(cache_key)
-                    
+                    sprite_cache.cache[cache_key] = scaled_surface
+                    sprite_cache.access_order.append(cache_key)
+
                     # Manage cache size
-                    while len(self.sprite_cache.cache) > self.sprite_cache.max_size:
-                        oldest_key = self.sprite_cache.access_order.pop(0)
-                        if oldest_key in self.sprite_cache.cache:
-                            del self.sprite_cache.cache[oldest_key]
+                    while len(sprite_cache.cache) > sprite_cache.max_size:
+                        oldest_key = sprite_cache.access_order.pop(0)
+                        if oldest_key in sprite_cache.cache:
+                            del sprite_cache.cache[oldest_key]
                 
                 # Adjust draw position for scaling
-                border_scaled = int(border_pixels * effective_tile_size / base_tile_size)
+                border_scaled = border_pixels * effective_tile_size // base_tile_size
                 draw_x = screen_x - border_scaled
                 draw_y = screen_y - border_scaled
                 surface.blit(scaled_surface, (draw_x, draw_y))
@@ -604,9 +773,9 @@ class OptimizedChunkManager:
             print(f"Error drawing full chunk: {e}")
             # Fallback to original main area only
             src_rect = pygame.Rect(border_pixels, border_pixels, main_area_size, main_area_size)
-            if (src_rect.right <= chunk.surface.get_width() and 
-                src_rect.bottom <= chunk.surface.get_height()):
-                main_area_surface = chunk.surface.subsurface(src_rect)
+            if (src_rect.right <= chunk_surface.get_width() and
+                src_rect.bottom <= chunk_surface.get_height()):
+                main_area_surface = chunk_surface.subsurface(src_rect)
                 surface.blit(main_area_surface, (screen_x, screen_y))
     
     def draw_updated_chunks_immediately(self, updated_chunk_keys):
@@ -654,12 +823,17 @@ class OptimizedChunkManager:
         
         # Calculate chunk size
         expanded_size = self.chunk_size + 2 * chunk.border
-        chunk_pixel_size = int(expanded_size * effective_tile_size)
+        chunk_pixel_size = expanded_size * effective_tile_size
         
         # Frustum culling - only draw if visible
-        canvas_rect = self.world_planner.canvas_rect
-        if (screen_x + chunk_pixel_size < canvas_rect.left or screen_x > canvas_rect.right or
-            screen_y + chunk_pixel_size < canvas_rect.top or screen_y > canvas_rect.bottom):
+        if self._cull_bounds is not None:
+            cull_left, cull_right, cull_top, cull_bottom = self._cull_bounds
+        else:
+            canvas_rect = self.world_planner.canvas_rect
+            cull_left, cull_right, cull_top, cull_bottom = (
+                canvas_rect.left, canvas_rect.right, canvas_rect.top, canvas_rect.bottom)
+        if (screen_x + chunk_pixel_size < cull_left or screen_x > cull_right or
+            screen_y + chunk_pixel_size < cull_top or screen_y > cull_bottom):
             return
         
         # Draw the chunk
@@ -668,7 +842,7 @@ class OptimizedChunkManager:
             surface.blit(chunk.surface, (screen_x, screen_y))
         else:
             # Scale the chunk surface
-            cache_key = (id(chunk.surface), chunk_pixel_size)
+            cache_key = (chunk.id, chunk.version, chunk_pixel_size)
             scaled_surface = self.sprite_cache.get_scaled_sprite(
                 cache_key, chunk.surface, (chunk_pixel_size, chunk_pixel_size)
             )
@@ -705,21 +879,41 @@ class OptimizedChunkManager:
         end_tile_y = min(self.world_planner.world_height - 1,
                         (camera_y + height + padding) // effective_tile_size + 1)
         
-        # Convert to chunk coordinates
-        start_chunk_x = int(start_tile_x) // self.chunk_size
-        start_chunk_y = int(start_tile_y) // self.chunk_size
-        end_chunk_x = int(end_tile_x) // self.chunk_size
-        end_chunk_y = int(end_tile_y) // self.chunk_size
-        
-        # World chunk bounds
-        max_chunk_x = (self.world_planner.world_width - 1) // self.chunk_size
-        max_chunk_y = (self.world_planner.world_height - 1) // self.chunk_size
+        # Convert to chunk coordinates - shift when chunk_size is a power of two,
+        # floor-division otherwise
+        shift = self._chunk_size_shift
+        if shift is not None:
+            start_chunk_x = start_tile_x >> shift
+            start_chunk_y = start_tile_y >> shift
+            end_chunk_x = end_tile_x >> shift
+            end_chunk_y = end_tile_y >> shift
+            max_chunk_x = (self.world_planner.world_width - 1) >> shift
+            max_chunk_y = (self.world_planner.world_height - 1) >> shift
+        else:
+            start_chunk_x = start_tile_x // self.chunk_size
+            start_chunk_y = start_tile_y // self.chunk_size
+            end_chunk_x = end_tile_x // self.chunk_size
+            end_chunk_y = end_tile_y // self.chunk_size
+            max_chunk_x = (self.world_planner.world_width - 1) // self.chunk_size
+            max_chunk_y = (self.world_planner.world_height - 1) // self.chunk_size
         
         # Generate visible chunk keys
-        visible_chunks = []
-        for cy in range(max(0, start_chunk_y), min(max_chunk_y + 1, end_chunk_y + 1)):
-            for cx in range(max(0, start_chunk_x), min(max_chunk_x + 1, end_chunk_x + 1)):
-                visible_chunks.append((cx, cy))
+        lo_x = max(0, start_chunk_x)
+        hi_x = min(max_chunk_x, end_chunk_x)
+        lo_y = max(0, start_chunk_y)
+        hi_y = min(max_chunk_y, end_chunk_y)
+
+        cell_count = max(0, hi_x - lo_x + 1) * max(0, hi_y - lo_y + 1)
+        if cell_count > self.quadtree_scan_threshold:
+            # Zoomed far out: query the spatial index instead of walking every
+            # grid cell. Only materialized chunks are returned - empty cells in
+            # a view this large have nothing to draw anyway.
+            visible_chunks = self._chunk_index.query(lo_x, lo_y, hi_x, hi_y)
+        else:
+            visible_chunks = []
+            for cy in range(lo_y, hi_y + 1):
+                for cx in range(lo_x, hi_x + 1):
+                    visible_chunks.append((cx, cy))
         
         # Cache results
         self.visible_chunks_cache = visible_chunks
@@ -731,26 +925,63 @@ class OptimizedChunkManager:
     def render_chunks_optimized(self, visible_chunks, base_tile_size):
         """Optimized chunk rendering with immediate brush update support"""
         chunks_rendered = 0
-        
-        # Initialize immediate render set if it doesn't exist
-        if not hasattr(self, 'immediate_render_chunks'):
-            self.immediate_render_chunks = set()
-        
+
         # PRIORITY: Render immediate chunks first (from brush operations) with no limits
-        immediate_chunks_to_render = []
-        for chunk_key in list(self.immediate_render_chunks):
-            if chunk_key in visible_chunks and chunk_key in self.chunks:
-                chunk = self.chunks[chunk_key]
-                # Always render immediate chunks, regardless of dirty state
-                immediate_chunks_to_render.append(chunk)
-        
-        # Render immediate chunks without limits
-        for chunk in immediate_chunks_to_render:
-            chunk.render(self.world_planner, base_tile_size, self.sprite_cache)
-            chunks_rendered += 1
-        
-        # Clear the immediate render set after processing
-        self.immediate_render_chunks.clear()
+        # Swap the set out in O(1) instead of snapshotting it with list() and
+        # clearing afterwards - avoids a full-set copy on every brush frame
+        pending_immediate = self.immediate_render_chunks
+        self.immediate_render_chunks = set()
+
+        # Collect futures that completed since last frame; a worker that blew
+        # up must not vanish silently - its chunk stays dirty, so log the
+        # error and let the normal path retry it
+        still_pending = {}
+        for key, future in self._pending_renders.items():
+            if future.done():
+                exc = future.exception()
+                if exc is not None:
+                    log.error("Async render of chunk %s failed: %s", key, exc)
+            else:
+                still_pending[key] = future
+        self._pending_renders = still_pending
+
+        # Dispatch immediate chunks to the worker pool so a brush stroke that
+        # touches many chunks rasterizes in parallel instead of serially
+        immediate_keys_rendered = set()
+        frame_futures = []
+        for chunk_key in pending_immediate:
+            if chunk_key not in visible_chunks or chunk_key not in self.chunks:
+                continue
+            if chunk_key in self._pending_renders:
+                # Still rasterizing from a previous frame - don't double-submit
+                immediate_keys_rendered.add(chunk_key)
+                continue
+            chunk = self.chunks[chunk_key]
+            # Always render immediate chunks, regardless of dirty state
+            future = self.render_pool.submit(
+                chunk.render, self.world_planner, base_tile_size, self.sprite_cache
+            )
+            self._pending_renders[chunk_key] = future
+            frame_futures.append((chunk_key, future))
+            immediate_keys_rendered.add(chunk_key)
+
+        if frame_futures:
+            # Give the pool a slice of the frame budget; chunks still pending at
+            # the deadline stay dirty and are picked up next frame
+            wait([future for _, future in frame_futures], timeout=self.render_frame_budget)
+            for chunk_key, future in frame_futures:
+                if future.done():
+                    del self._pending_renders[chunk_key]
+                    exc = future.exception()
+                    if exc is not None:
+                        # Failed render: the chunk is still dirty, so requeue
+                        # it instead of counting it as rendered
+                        log.error("Async render of chunk %s failed: %s", chunk_key, exc)
+                        self.immediate_render_chunks.add(chunk_key)
+                    else:
+                        chunks_rendered += 1
+                else:
+                    self.immediate_render_chunks.add(chunk_key)
         
         # Then render other chunks with normal limits
         if chunks_rendered < self.max_chunks_per_frame:
@@ -770,14 +1001,13 @@ class OptimizedChunkManager:
                 if chunks_rendered >= self.max_chunks_per_frame:
                     break
                     
-                # Skip if already rendered as immediate chunk
-                if key in immediate_chunks_to_render:
+                # Skip if already rendered as immediate chunk, or still being
+                # rasterized by a worker - rendering it here too would race
+                # the in-flight job on the same chunk
+                if key in immediate_keys_rendered or key in self._pending_renders:
                     continue
-                    
-                if key not in self.chunks:
-                    self.chunks[key] = OptimizedChunk(key[0], key[1], self.chunk_size)
-                
-                chunk = self.chunks[key]
+
+                chunk = self.get_or_create_chunk(key[0], key[1])
                 if chunk.dirty and chunk.needs_rerender(self.world_planner, base_tile_size):
                     chunk.render(self.world_planner, base_tile_size, self.sprite_cache)
                     chunks_rendered += 1
@@ -792,7 +1022,12 @@ class OptimizedChunkManager:
         # Calculate effective tile size
         effective_tile_size = int(self.world_planner.tile_size * zoom)
         base_tile_size = self.world_planner.tile_size
-        
+
+        # Snapshot culling bounds once per frame - downstream culling unpacks
+        # this tuple instead of re-reading Rect attributes per chunk
+        canvas_rect = self.world_planner.canvas_rect
+        self._cull_bounds = (canvas_rect.left, canvas_rect.right, canvas_rect.top, canvas_rect.bottom)
+
         # Get visible chunks with optimization
         visible_chunks = self.get_visible_chunks_optimized(
             camera_x, camera_y,
@@ -809,53 +1044,142 @@ class OptimizedChunkManager:
     
     def draw_chunks_to_screen_optimized(self, surface, visible_chunks, camera_x, camera_y, effective_tile_size):
         """Fixed chunk drawing with proper rendering order and no overlaps"""
-        world_width = self.world_planner.world_width
-        world_height = self.world_planner.world_height
-        max_chunk_x = (world_width - 1) // self.chunk_size
-        max_chunk_y = (world_height - 1) // self.chunk_size
-        
-        # Pre-calculate screen bounds for culling
-        screen_left = self.world_planner.toolbar_width + self.world_planner.resize_handle_width
-        screen_right = self.world_planner.screen_width
-        screen_top = 0
-        screen_bottom = self.world_planner.screen_height
-        
-        base_tile_size = self.world_planner.tile_size
-        
-        # FIXED: Sort chunks for consistent left-to-right, top-to-bottom rendering
-        sorted_chunks = sorted(visible_chunks, key=lambda chunk: (chunk[1], chunk[0]))  # Sort by Y first, then X
-        
-        # Batch similar operations
+        # Hoist attribute reads to locals - each access below is a dict lookup
+        # that would otherwise repeat for every visible chunk
+        wp = self.world_planner
+        chunk_size = self.chunk_size
+        chunks = self.chunks
+        world_width = wp.world_width
+        world_height = wp.world_height
+        max_chunk_x = (world_width - 1) // chunk_size
+        max_chunk_y = (world_height - 1) // chunk_size
+
+        screen_left = wp.toolbar_width + wp.resize_handle_width
+
+        # Unified per-frame culling bounds (snapshotted in render_world_optimized)
+        if self._cull_bounds is not None:
+            cull_left, cull_right, cull_top, cull_bottom = self._cull_bounds
+        else:
+            cull_left = screen_left
+            cull_right = wp.screen_width
+            cull_top = 0
+            cull_bottom = wp.screen_height
+
+        base_tile_size = wp.tile_size
+
+        # Fold per-chunk position math into one multiply-add: precompute the
+        # chunk stride in pixels and the camera offsets outside the loop
+        chunk_px = chunk_size * effective_tile_size
+        offset_x = screen_left - camera_x
+        offset_y = -camera_y
+
+        if np is not None and len(chunks) >= 16:
+            # Vectorized sweep over the SoA position arrays - one NumPy compare
+            # replaces the per-chunk Python culling loop
+            chunks_to_draw = self._cull_chunks_vectorized(
+                chunk_px, offset_x, offset_y, cull_left, cull_right, cull_top, cull_bottom)
+        else:
+            # FIXED: Sort chunks for consistent left-to-right, top-to-bottom rendering
+            sorted_chunks = sorted(visible_chunks, key=lambda chunk: (chunk[1], chunk[0]))  # Sort by Y first, then X
+
+            # Batch similar operations
+            chunks_to_draw = []
+
+            for key in sorted_chunks:
+                chunk_x, chunk_y = key
+
+                # Skip chunks outside world bounds
+                if not (0 <= chunk_x <= max_chunk_x and 0 <= chunk_y <= max_chunk_y):
+                    continue
+
+                chunk = chunks.get(key)
+                if chunk is None or chunk.surface is None:
+                    continue
+
+                # FIXED: Calculate screen position for MAIN area only (no border)
+                main_screen_x = chunk_x * chunk_px + offset_x
+                main_screen_y = chunk_y * chunk_px + offset_y
+
+                # Calculate main chunk size (without border)
+                main_chunk_pixel_size = chunk_px
+
+                # Frustum culling - skip chunks completely outside screen
+                if (main_screen_x + main_chunk_pixel_size < cull_left or main_screen_x > cull_right or
+                    main_screen_y + main_chunk_pixel_size < cull_top or main_screen_y > cull_bottom):
+                    continue
+
+                chunks_to_draw.append((chunk, main_screen_x, main_screen_y, main_chunk_pixel_size))
+        
+        # Dispatch once per frame: the GPU texture path handles every zoom level
+        # (scaling is free on the GPU); otherwise native zoom is the dominant
+        # case and gets a specialized path with scaling branches excised
+        if self.renderer is not None and _HAS_SDL2_VIDEO:
+            self._draw_chunks_textured(chunks_to_draw, base_tile_size, effective_tile_size)
+        elif effective_tile_size == base_tile_size:
+            self._draw_chunks_native(surface, chunks_to_draw, base_tile_size)
+        else:
+            self._draw_chunks_scaled(surface, chunks_to_draw, base_tile_size, effective_tile_size)
+
+    def _cull_chunks_vectorized(self, chunk_px, offset_x, offset_y,
+                                cull_left, cull_right, cull_top, cull_bottom):
+        """Frustum-cull all created chunks in one vectorized pass over SoA arrays"""
+        if self._soa_dirty:
+            keys = list(self.chunks.keys())
+            self._soa_keys = keys
+            count = len(keys)
+            self._soa_x = np.fromiter((key[0] for key in keys), dtype=np.int32, count=count)
+            self._soa_y = np.fromiter((key[1] for key in keys), dtype=np.int32, count=count)
+            self._soa_dirty = False
+
+        screen_x = self._soa_x * chunk_px + offset_x
+        screen_y = self._soa_y * chunk_px + offset_y
+        visible = ~((screen_x + chunk_px < cull_left) | (screen_x > cull_right) |
+                    (screen_y + chunk_px < cull_top) | (screen_y > cull_bottom))
+        idxs = np.nonzero(visible)[0]
+
+        # Preserve the top-to-bottom, left-to-right draw order
+        order = np.lexsort((self._soa_x[idxs], self._soa_y[idxs]))
+
+        chunks = self.chunks
+        soa_keys = self._soa_keys
         chunks_to_draw = []
-        
-        for key in sorted_chunks:
-            chunk_x, chunk_y = key
-            
-            # Skip chunks outside world bounds
-            if not (0 <= chunk_x <= max_chunk_x and 0 <= chunk_y <= max_chunk_y):
-                continue
-            
-            if key not in self.chunks or self.chunks[key].surface is None:
-                continue
-            
-            chunk = self.chunks[key]
-            
-            # FIXED: Calculate screen position for MAIN area only (no border)
-            main_screen_x = (chunk.x * self.chunk_size * effective_tile_size - 
-                            camera_x + screen_left)
-            main_screen_y = (chunk.y * self.chunk_size * effective_tile_size - camera_y)
-            
-            # Calculate main chunk size (without border)
-            main_chunk_pixel_size = self.chunk_size * effective_tile_size
-            
-            # Frustum culling - skip chunks completely outside screen
-            if (main_screen_x + main_chunk_pixel_size < screen_left or main_screen_x > screen_right or
-                main_screen_y + main_chunk_pixel_size < screen_top or main_screen_y > screen_bottom):
-                continue
-            
-            chunks_to_draw.append((chunk, main_screen_x, main_screen_y, main_chunk_pixel_size))
-        
-        # Draw chunks in batch with NO OVERLAPS
+        for i in idxs[order]:
+            chunk = chunks.get(soa_keys[i])
+            if chunk is not None and chunk.surface is not None:
+                chunks_to_draw.append((chunk, int(screen_x[i]), int(screen_y[i]), chunk_px))
+        return chunks_to_draw
+
+    def _draw_chunks_textured(self, chunks_to_draw, base_tile_size, effective_tile_size):
+        """GPU draw path: upload re-rendered chunks once, then batched texture draws.
+
+        No sprite_cache involvement - the GPU scales textures for free, so
+        scaled-surface caching only applies to the software paths.
+        """
+        renderer = self.renderer
+        for chunk, screen_x, screen_y, _chunk_pixel_size in chunks_to_draw:
+            # Re-upload only when the chunk was re-rendered since last upload
+            if chunk.texture is None or chunk.texture_version != chunk.version:
+                try:
+                    chunk.texture = Texture.from_surface(renderer, chunk.surface)
+                    chunk.texture_version = chunk.version
+                except Exception as e:
+                    print(f"Error uploading chunk texture: {e}")
+                    continue
+
+            border_scaled = chunk.border * effective_tile_size
+            expanded_px = (chunk.size + 2 * chunk.border) * effective_tile_size
+            chunk.texture.draw(dstrect=(screen_x - border_scaled, screen_y - border_scaled,
+                                        expanded_px, expanded_px))
+
+    def _draw_chunks_native(self, surface, chunks_to_draw, base_tile_size):
+        """Specialized 1x-zoom draw path: direct blits, no cache keys, no scaling"""
+        blit = surface.blit
+        for chunk, screen_x, screen_y, _chunk_pixel_size in chunks_to_draw:
+            border_pixels = chunk.border * base_tile_size
+            blit(chunk.surface, (screen_x - border_pixels, screen_y - border_pixels))
+
+    def _draw_chunks_scaled(self, surface, chunks_to_draw, base_tile_size, effective_tile_size):
+        """General draw path for non-native zoom levels"""
         for chunk, screen_x, screen_y, chunk_pixel_size in chunks_to_draw:
-            self.draw_chunk_main_area_only(surface, chunk, screen_x, screen_y, chunk_pixel_size, 
+            self.draw_chunk_main_area_only(surface, chunk, screen_x, screen_y, chunk_pixel_size,
                                         base_tile_size, effective_tile_size)
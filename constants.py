@@ -1,7 +1,7 @@
 # Application version
 APP_VERSION = "21"
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class Tool(Enum):
@@ -19,6 +19,11 @@ class Layer(Enum):
     MIDGROUND = 1
 
 
+class BrushShape(IntEnum):
+    SQUARE = 0
+    CIRCLE = 1
+
+
 class TileConnection(Enum):
     NONE = 0
     TOP = 1
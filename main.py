@@ -4,15 +4,67 @@ import pygame
 import pygame.freetype
 from pygame.locals import *
 from tkinter import Tk, filedialog
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from functools import lru_cache, partial
 import math
 import json
+import logging
 
-from constants import Tool, Layer, TileConnection, APP_VERSION
+from constants import Tool, Layer, TileConnection, BrushShape, APP_VERSION
 from tile_renderer import OptimizedTileRenderer  # Use optimized version
 from block_manager import BlockManager
 from chunk_manager import OptimizedChunkManager  # Use optimized version
 from undo_manager import UndoRedoManager
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+
+def _freeze(value):
+    """Recursively convert a JSON-ish value into a hashable key"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Fields copied from the selected palette block into placed block data
+_BLOCK_DATA_FIELDS = (
+    ('id', None),
+    ('category', 'custom'),
+    ('isBackground', False),
+    ('tileSet', False),
+    ('tileMode', 'standard'),
+    ('tileable', {}),
+)
+
+
+# Posted by the I/O executor when a world file has been parsed off-thread
+WORLD_LOADED_EVENT = pygame.event.custom_type()
+
+
+# Accepted background image suffixes (lowercase, no dot)
+_BG_SUFFIXES = frozenset({'png', 'jpg', 'jpeg', 'bmp'})
+
+# Background directories resolved once at import - repeated dirname/abspath
+# and exists() stats per call add up if this is hit outside startup
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_BG_DIRS = tuple(d for d in (os.path.join(_BASE_DIR, "worldbgs"),
+                             os.path.join(_BASE_DIR, "backgrounds"))
+                 if os.path.isdir(d))
+
 
 class OptimizedBackgroundManager:
     """Optimized background manager with advanced caching and performance improvements"""
@@ -22,47 +74,59 @@ class OptimizedBackgroundManager:
         self.background_list = []
         self.current_background = None
         
-        # Performance optimizations
-        self.scaled_background_cache = {}
+        # Performance optimizations - OrderedDict gives O(1) LRU eviction
+        self.scaled_background_cache = OrderedDict()
         self.last_cache_size = None
+        # Bumped whenever cached scales can go stale (clear, new surface,
+        # quality switch); lets callers hold a scaled surface across frames
+        self.cache_version = 0
         self.cache_hits = 0
         self.cache_misses = 0
-        
+
+        # Backgrounds are full-screen and photographic, so the faster
+        # SDL_SoftStretch scale is the default; smoothscale is opt-in
+        self.high_quality_bg = False
+
+        # Async loading state - decode happens on worker threads, .convert()
+        # on the main thread as futures complete (it needs the display surface)
+        self.load_executor = None
+        self.pending_loads = {}
+
         self.load_backgrounds()
     
     def clear_background_cache(self):
         """Clear cached scaled backgrounds"""
         self.scaled_background_cache.clear()
         self.last_cache_size = None
+        self.cache_version += 1
         print(f"Background cache cleared. Stats - Hits: {self.cache_hits}, Misses: {self.cache_misses}")
         self.cache_hits = 0
         self.cache_misses = 0
     
     def get_background_directories(self):
         """Get directories containing background images"""
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        dirs = []
-        
-        worldbgs_dir = os.path.join(base_dir, "worldbgs")
-        if os.path.exists(worldbgs_dir):
-            dirs.append(worldbgs_dir)
-        
-        bg_dir = os.path.join(base_dir, "backgrounds")
-        if os.path.exists(bg_dir):
-            dirs.append(bg_dir)
-        
-        return dirs
+        return list(_BG_DIRS)
     
     def scan_directory_for_backgrounds(self, directory):
         """Recursively scan directory for background image files"""
-        bg_files = []
-        
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                    full_path = os.path.join(root, file)
-                    bg_files.append(full_path)
-        
+        # os.scandir stats each entry once (os.walk stats twice) and the
+        # DirEntry type checks avoid extra syscalls on large directories
+        bg_files = set()
+        stack = deque([directory])
+
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif (entry.is_file(follow_symlinks=False) and
+                              entry.name.rpartition('.')[2].lower() in _BG_SUFFIXES):
+                            bg_files.add(entry.path)
+            except OSError as e:
+                print(f"Error scanning {current_dir}: {e}")
+
         return bg_files
     
     def load_backgrounds(self):
@@ -80,8 +144,6 @@ class OptimizedBackgroundManager:
             self.current_background = 'none'
             return
         
-        loaded_count = 0
-        
         # Add "None" option first
         self.background_list.append({
             'id': 'none',
@@ -89,57 +151,102 @@ class OptimizedBackgroundManager:
             'surface': None,
             'path': None
         })
-        
+        self.current_background = 'none'
+
+        # Union the per-directory sets so files visible through overlapping
+        # worldbgs/backgrounds trees are only loaded once
+        bg_files = set()
         for bg_dir in bg_dirs:
             print(f"Loading backgrounds from: {bg_dir}")
-            bg_files = self.scan_directory_for_backgrounds(bg_dir)
-            
-            for bg_path in bg_files:
-                if self.load_background_file(bg_path):
-                    loaded_count += 1
-        
-        print(f"Loaded {loaded_count} background images")
-        
-        if len(self.background_list) > 1:
-            self.current_background = self.background_list[1]['id']
-        else:
-            self.current_background = 'none'
-    
-    def load_background_file(self, bg_path):
-        """Load a single background file with optimization"""
-        try:
-            filename = os.path.basename(bg_path)
-            base_name = os.path.splitext(filename)[0]
-            
-            bg_name = base_name.replace('_', ' ').replace('-', ' ').title()
-            
-            bg_id = base_name.lower()
-            original_id = bg_id
-            counter = 1
-            while bg_id in self.backgrounds:
-                bg_id = f"{original_id}_{counter}"
-                counter += 1
-            
-            # Load and immediately convert to display format for optimal performance
-            bg_surface = pygame.image.load(bg_path)
-            bg_surface = bg_surface.convert()  # Convert for faster blitting
-            
-            bg_info = {
-                'id': bg_id,
-                'name': bg_name,
-                'surface': bg_surface,
-                'path': bg_path
-            }
-            
-            self.backgrounds[bg_id] = bg_info
-            self.background_list.append(bg_info)
-            
-            print(f"Loaded background: {bg_name} from {bg_path}")
-            return True
-            
-        except Exception as e:
-            print(f"Error loading background {bg_path}: {e}")
+            bg_files |= self.scan_directory_for_backgrounds(bg_dir)
+
+        # Decode images on worker threads so the window is responsive right
+        # away; poll_background_loading() drains the results each frame
+        self.load_executor = ThreadPoolExecutor(max_workers=4)
+        self.pending_loads = {
+            bg_path: self.load_executor.submit(pygame.image.load, bg_path)
+            for bg_path in sorted(bg_files)
+        }
+        print(f"Queued {len(self.pending_loads)} background images for loading")
+
+    def poll_background_loading(self):
+        """Drain finished async image loads; called once per frame from the main loop"""
+        if not self.pending_loads:
             return False
+
+        done_paths = [path for path, future in self.pending_loads.items() if future.done()]
+        loaded_any = False
+
+        display = pygame.display.get_surface()
+
+        for bg_path in done_paths:
+            future = self.pending_loads.pop(bg_path)
+            try:
+                bg_surface = future.result()
+                # Conversion must run on the thread that owns the display.
+                # RGBA sources with a fully-opaque alpha channel (most PNG
+                # backgrounds) can take the plain convert path; only truly
+                # translucent images keep per-pixel alpha
+                translucent = False
+                if bg_surface.get_flags() & pygame.SRCALPHA:
+                    try:
+                        translucent = pygame.surfarray.pixels_alpha(bg_surface).min() < 255
+                    except Exception:
+                        translucent = False
+                if translucent:
+                    bg_surface = bg_surface.convert_alpha()
+                else:
+                    # Converting against the display surface and stripping
+                    # surface alpha/colorkey keeps blits on SDL's
+                    # matching-format fast path
+                    if display is not None:
+                        bg_surface = bg_surface.convert(display)
+                    else:
+                        bg_surface = bg_surface.convert()
+                    bg_surface.set_alpha(None)
+                    bg_surface.set_colorkey(None)
+                self.register_background_surface(bg_path, bg_surface)
+                loaded_any = True
+            except Exception as e:
+                print(f"Error loading background {bg_path}: {e}")
+
+        # Promote the first real background once it arrives
+        if loaded_any and self.current_background == 'none' and len(self.background_list) > 1:
+            self.current_background = self.background_list[1]['id']
+
+        if not self.pending_loads and self.load_executor is not None:
+            self.load_executor.shutdown(wait=False)
+            self.load_executor = None
+            print(f"Loaded {len(self.background_list) - 1} background images")
+
+        return loaded_any
+
+    def register_background_surface(self, bg_path, bg_surface):
+        """Register a decoded background surface under a unique id"""
+        filename = os.path.basename(bg_path)
+        base_name = os.path.splitext(filename)[0]
+
+        bg_name = base_name.replace('_', ' ').replace('-', ' ').title()
+
+        bg_id = base_name.lower()
+        original_id = bg_id
+        counter = 1
+        while bg_id in self.backgrounds:
+            bg_id = f"{original_id}_{counter}"
+            counter += 1
+
+        bg_info = {
+            'id': bg_id,
+            'name': bg_name,
+            'surface': bg_surface,
+            'path': bg_path
+        }
+
+        self.backgrounds[bg_id] = bg_info
+        self.background_list.append(bg_info)
+        self.cache_version += 1
+
+        print(f"Loaded background: {bg_name} from {bg_path}")
     
     def get_current_background_cached(self, target_size=None):
         """Get current background with advanced caching for scaled versions"""
@@ -151,35 +258,49 @@ class OptimizedBackgroundManager:
         if target_size is None:
             return bg_surface
         
-        # Use cache for scaled backgrounds
-        cache_key = (self.current_background, target_size)
+        # Use cache for scaled backgrounds - quantize to 4-pixel buckets so a
+        # mouse-drag resize doesn't mint a fresh cache entry per pixel
+        cache_key = (self.current_background, (target_size[0] & ~3, target_size[1] & ~3))
         
         if cache_key in self.scaled_background_cache:
             self.cache_hits += 1
+            self.scaled_background_cache.move_to_end(cache_key)  # Refresh recency
             return self.scaled_background_cache[cache_key]
         
         self.cache_misses += 1
         
         # Create scaled version with optimal scaling
         try:
-            if target_size == (bg_surface.get_width(), bg_surface.get_height()):
+            src_w, src_h = bg_surface.get_width(), bg_surface.get_height()
+            if abs(target_size[0] - src_w) <= 2 and abs(target_size[1] - src_h) <= 2:
+                # Within a couple of pixels of the source - not worth a rescale
                 scaled_bg = bg_surface
-            else:
-                # Use smoothscale for better quality
+            elif target_size == (src_w * 2, src_h * 2):
+                # Exact 2x: scale2x is a specialized near-memcpy-speed path
+                scaled_bg = pygame.transform.scale2x(bg_surface)
+                scaled_bg = scaled_bg.convert()
+            elif target_size == (src_w * 4, src_h * 4):
+                # Exact 4x: two scale2x passes still beat a generic scale
+                scaled_bg = pygame.transform.scale2x(pygame.transform.scale2x(bg_surface))
+                scaled_bg = scaled_bg.convert()
+            elif self.high_quality_bg:
                 scaled_bg = pygame.transform.smoothscale(bg_surface, target_size)
                 scaled_bg = scaled_bg.convert()  # Convert for faster blitting
-        except:
-            scaled_bg = pygame.transform.scale(bg_surface, target_size)
+            else:
+                # transform.scale dispatches to SDL_SoftStretch - cheaper per
+                # pixel than smoothscale and indistinguishable for photo BGs
+                scaled_bg = pygame.transform.scale(bg_surface, target_size)
+                scaled_bg = scaled_bg.convert()
+        except pygame.error:
+            # Pixel-format mismatches can make the fast path raise
+            scaled_bg = pygame.transform.smoothscale(bg_surface, target_size)
             scaled_bg = scaled_bg.convert()
         
-        # Cache management - keep cache size reasonable
-        if len(self.scaled_background_cache) > 15:
-            # Remove oldest entries (FIFO)
-            oldest_keys = list(self.scaled_background_cache.keys())[:5]
-            for key in oldest_keys:
-                del self.scaled_background_cache[key]
-        
+        # Cache management - evict the least-recently-used entry
         self.scaled_background_cache[cache_key] = scaled_bg
+        while len(self.scaled_background_cache) > 15:
+            self.scaled_background_cache.popitem(last=False)
+
         return scaled_bg
     
     def get_current_background(self):
@@ -190,12 +311,16 @@ class OptimizedBackgroundManager:
         """Get list of all available backgrounds"""
         return self.background_list
     
-    def set_current_background(self, bg_id):
+    def set_current_background(self, bg_id, target_size=None):
         """Set the current background by ID"""
         if bg_id == 'none' or bg_id in self.backgrounds:
             if self.current_background != bg_id:
                 self.current_background = bg_id
                 self.clear_background_cache()  # Clear cache when background changes
+                if target_size is not None:
+                    # Eagerly populate the scaled cache so the first draw frame
+                    # after switching doesn't pay the scale cost
+                    self.get_current_background_cached(target_size)
                 print(f"Background changed to: {bg_id}")
             return True
         return False
@@ -381,13 +506,55 @@ class OptimizedTooltipManager:
         self.tooltip_surface = None
         self.tooltip_rect = None
         
-        # Advanced caching system
-        self.surface_cache = {}
+        # Advanced caching system - OrderedDict gives true LRU eviction
+        self.surface_cache = OrderedDict()
+        self.max_cache_size = 100
         self.cache_hits = 0
         self.cache_misses = 0
-        
+
+        # Shared 9-slice chrome template - all tooltips use identical styling,
+        # so new surfaces stretch this instead of re-drawing the rects
+        self.bg_template = self._build_bg_template()
+
         # Pre-rendered common tooltips
         self.prerender_common_tooltips()
+
+    def _build_bg_template(self):
+        """Build the shared tooltip background template once"""
+        template = pygame.Surface((32, 32), pygame.SRCALPHA)
+        template = template.convert_alpha()
+        template.fill((80, 80, 30, 240))
+        pygame.draw.rect(template, (255, 255, 150), (0, 0, 32, 32), 2)
+        return template
+
+    def _blit_nine_slice(self, surface, width, height):
+        """Stretch the background template onto a (width, height) surface"""
+        template = self.bg_template
+        corner = 4
+        tw, th = template.get_width(), template.get_height()
+
+        # Solid center via fill (cheapest path), chrome from the template
+        surface.fill((80, 80, 30, 240), (corner, corner, width - 2 * corner, height - 2 * corner))
+
+        # Corners copied unscaled
+        surface.blit(template, (0, 0), (0, 0, corner, corner))
+        surface.blit(template, (width - corner, 0), (tw - corner, 0, corner, corner))
+        surface.blit(template, (0, height - corner), (0, th - corner, corner, corner))
+        surface.blit(template, (width - corner, height - corner), (tw - corner, th - corner, corner, corner))
+
+        # Edges stretched between the corners
+        span_w = width - 2 * corner
+        span_h = height - 2 * corner
+        if span_w > 0:
+            top = pygame.transform.scale(template.subsurface((corner, 0, tw - 2 * corner, corner)), (span_w, corner))
+            surface.blit(top, (corner, 0))
+            bottom = pygame.transform.scale(template.subsurface((corner, th - corner, tw - 2 * corner, corner)), (span_w, corner))
+            surface.blit(bottom, (corner, height - corner))
+        if span_h > 0:
+            left = pygame.transform.scale(template.subsurface((0, corner, corner, th - 2 * corner)), (corner, span_h))
+            surface.blit(left, (0, corner))
+            right = pygame.transform.scale(template.subsurface((tw - corner, corner, corner, th - 2 * corner)), (corner, span_h))
+            surface.blit(right, (width - corner, corner))
         
     def prerender_common_tooltips(self):
         """Pre-render commonly used tooltips"""
@@ -407,8 +574,35 @@ class OptimizedTooltipManager:
             "No background"
         ]
         
-        for tooltip_text in common_tooltips:
-            self.create_tooltip_surface_cached(tooltip_text, (0, 0), prerender_only=True)
+        # Render all the text surfaces in one pass, then pack every common
+        # tooltip into one vertically-stacked atlas surface: a single
+        # convert_alpha replaces 13, and the cache holds zero-copy subsurface
+        # views into the atlas
+        padding = 8
+        rendered = [(text, self.font.render(text, (255, 255, 255))) for text in common_tooltips]
+
+        atlas_width = max(text_rect.width for _, (_, text_rect) in rendered) + padding * 2
+        atlas_height = sum(text_rect.height + padding * 2 for _, (_, text_rect) in rendered)
+
+        self.tooltip_atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
+        self.tooltip_atlas = self.tooltip_atlas.convert_alpha()
+        self.atlas_rects = {}
+
+        y_cursor = 0
+        for text, (text_surface, text_rect) in rendered:
+            tooltip_width = text_rect.width + padding * 2
+            tooltip_height = text_rect.height + padding * 2
+
+            region = pygame.Rect(0, y_cursor, tooltip_width, tooltip_height)
+            tooltip_view = self.tooltip_atlas.subsurface(region)
+            tooltip_view.fill((80, 80, 30, 240))
+            pygame.draw.rect(tooltip_view, (255, 255, 150),
+                            (0, 0, tooltip_width, tooltip_height), 2)
+            tooltip_view.blit(text_surface, (padding, padding))
+
+            self.atlas_rects[text] = region
+            self.surface_cache[text] = tooltip_view
+            y_cursor += tooltip_height
     
     def set_tooltip(self, text, mouse_pos):
         """Set tooltip text and position with advanced caching"""
@@ -429,6 +623,7 @@ class OptimizedTooltipManager:
         # Check cache first
         if text in self.surface_cache:
             self.tooltip_surface = self.surface_cache[text]
+            self.surface_cache.move_to_end(text)  # Refresh recency
             self.cache_hits += 1
         else:
             self.cache_misses += 1
@@ -444,23 +639,17 @@ class OptimizedTooltipManager:
             surface = pygame.Surface((tooltip_width, tooltip_height), pygame.SRCALPHA)
             surface = surface.convert_alpha()  # Convert for faster blitting
             
-            # Use batch drawing for efficiency
-            pygame.draw.rect(surface, (80, 80, 30, 240), 
-                            (0, 0, tooltip_width, tooltip_height))
-            pygame.draw.rect(surface, (255, 255, 150), 
-                            (0, 0, tooltip_width, tooltip_height), 2)
-            
+            # Chrome comes from the shared 9-slice template
+            self._blit_nine_slice(surface, tooltip_width, tooltip_height)
+
             surface.blit(text_surface, (padding, padding))
             
-            # Cache management - limit cache size but keep frequently used tooltips
-            if len(self.surface_cache) > 100:
-                # Remove less common tooltips (keep first 50 which are likely common ones)
-                cache_items = list(self.surface_cache.items())
-                for key, _ in cache_items[50:]:
-                    del self.surface_cache[key]
-            
             self.surface_cache[text] = surface
             self.tooltip_surface = surface
+
+            # Evict the least-recently-used entries, not the newest inserts
+            while len(self.surface_cache) > self.max_cache_size:
+                self.surface_cache.popitem(last=False)
         
         if prerender_only:
             return
@@ -522,7 +711,9 @@ class OptimizedHotkeyHelpManager:
         # Performance optimizations
         self.last_render_time = 0
         self.render_throttle = 100  # Only re-render every 100ms if needed
-        
+        self._last_content_hash = None  # Skip rebuilds when content is unchanged
+        self._layout = None  # (positions, width, height), recomputed on content change
+
         self.update_help()
     
     def get_current_hotkeys(self):
@@ -571,61 +762,61 @@ class OptimizedHotkeyHelpManager:
             return
             
         columns = self.get_current_hotkeys()
-        
-        # Pre-calculate dimensions
+
+        # Content memoization - mark_dirty() is called freely by the UI, but
+        # the hotkey list rarely changes, so a hash compare replaces dozens of
+        # freetype renders when the content is identical
+        content_hash = hash(tuple(tuple(column) for column in columns))
+        if content_hash == self._last_content_hash and self.surface is not None:
+            self.surface_dirty = False
+            return
+        self._last_content_hash = content_hash
+        self._layout = self._compute_layout(columns)
+        positions, total_width, max_height = self._layout
+
+        # Create surface with optimal format
+        self.surface = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
+        self.surface = self.surface.convert_alpha()  # Convert for faster blitting
+
+        # fill() hits SDL's fast path; draw.rect stays for the outline only
+        self.surface.fill((80, 80, 80, 240))
+        pygame.draw.rect(self.surface, (150, 150, 150, 120), (0, 0, total_width, max_height), 2)
+
+        # Layout is precomputed, so this loop is render-once-and-blit
+        for key, desc, x, y in positions:
+            key_surface, key_rect = self.font_small.render(key, (200, 200, 200))
+            self.surface.blit(key_surface, (x, y))
+            if desc:
+                desc_surface, _ = self.font_small.render(desc, (220, 220, 220))
+                self.surface.blit(desc_surface, (x + key_rect.width + 5, y))
+
+        self.surface_dirty = False
+        self.last_render_time = current_time
+
+    def _compute_layout(self, columns):
+        """Precompute (key, desc, x, y) positions and surface dimensions"""
         line_height = 14
         column_width = 140
         padding = 8
         column_gap = 20
-        
+
         total_width = len(columns) * column_width + (len(columns) - 1) * column_gap + padding * 2
         max_height = max(len(col) for col in columns) * line_height + padding * 2
-        
-        # Create surface with optimal format
-        self.surface = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
-        self.surface = self.surface.convert_alpha()  # Convert for faster blitting
-        
-        # Batch background drawing
-        pygame.draw.rect(self.surface, (80, 80, 80, 240), (0, 0, total_width, max_height))
-        pygame.draw.rect(self.surface, (150, 150, 150, 120), (0, 0, total_width, max_height), 2)
-        
-        # Optimized text rendering - batch by color
-        white_texts = []
-        light_gray_texts = []
-        
+
+        positions = []
         for col_idx, column in enumerate(columns):
             x_start = padding + col_idx * (column_width + column_gap)
             y = padding
-            
+
             for key, desc in column:
                 if key == "" and desc == "":
                     y += line_height // 2
                     continue
-                    
-                if desc == "":
-                    if key:
-                        light_gray_texts.append((key, (x_start, y)))
-                else:
-                    if key:
-                        key_surface, key_rect = self.font_small.render(key, (200, 200, 200))
-                        key_width = key_rect.width
-                        light_gray_texts.append((key, (x_start, y)))
-                        if desc:
-                            white_texts.append((desc, (x_start + key_width + 5, y)))
-                
+                if key:
+                    positions.append((key, desc, x_start, y))
                 y += line_height
-        
-        # Render texts in batches by color for efficiency
-        for text, pos in light_gray_texts:
-            text_surface, _ = self.font_small.render(text, (200, 200, 200))
-            self.surface.blit(text_surface, pos)
-            
-        for text, pos in white_texts:
-            text_surface, _ = self.font_small.render(text, (220, 220, 220))
-            self.surface.blit(text_surface, pos)
-        
-        self.surface_dirty = False
-        self.last_render_time = current_time
+
+        return positions, total_width, max_height
     
     def toggle_visibility(self):
         """Toggle help visibility"""
@@ -681,10 +872,16 @@ class OptimizedBrushManager:
             pattern = []
             radius = size - 1
             
-            if shape == 'square':
+            if shape == BrushShape.SQUARE:
                 for dy in range(-radius, radius + 1):
                     for dx in range(-radius, radius + 1):
                         pattern.append((dx, dy))
+            elif np is not None and radius > 0:
+                # One vectorized disk mask instead of the per-cell loop
+                side = 2 * radius + 1
+                ys, xs = np.indices((side, side)) - radius
+                for dy, dx in np.argwhere(xs * xs + ys * ys <= radius * radius) - radius:
+                    pattern.append((int(dx), int(dy)))
             else:  # circle
                 for dy in range(-radius, radius + 1):
                     for dx in range(-radius, radius + 1):
@@ -777,26 +974,34 @@ class OptimizedBrushManager:
         
         # Track new positions for efficient chunk updates
         new_positions_this_batch = []
-        
+
+        # Bedrock boundary inlined, and the attribute chains walked per tile
+        # bound to locals - LOAD_FAST beats attribute + subscript lookups in
+        # a loop that runs pattern-size times per interpolated position
+        first_bedrock_y = self.world_planner._first_bedrock_y
+        is_valid = self.world_planner.is_valid_position
+        stroke_add = self.stroke_positions.add
+        new_position = new_positions_this_batch.append
+
         # Process all interpolated positions with optimized collision detection
         for brush_center_x, brush_center_y in positions_to_process:
             for dx, dy in pattern:
                 tile_x, tile_y = brush_center_x + dx, brush_center_y + dy
-                
-                if not self.world_planner.is_valid_position(tile_x, tile_y):
+
+                if not is_valid(tile_x, tile_y):
                     continue
                 
                 if is_erase:
                     # FIXED: Check for bedrock before erasing
-                    if self.world_planner.is_bedrock_position(tile_y):
+                    if tile_y >= first_bedrock_y:
                         continue
                         
                     # Simple erase - just remove if exists (but not bedrock)
                     pos = (tile_x, tile_y)
                     if pos in layer_dict:
                         del layer_dict[pos]
-                        self.stroke_positions.add(pos)
-                        new_positions_this_batch.append(pos)
+                        stroke_add(pos)
+                        new_position(pos)
                 else:
                     # OPTIMIZED PLACEMENT with brush replacement behavior
                     if sprite_bounds and len(sprite_bounds) > 1:
@@ -813,8 +1018,8 @@ class OptimizedBrushManager:
                         can_place = True
                         for bound_dx, bound_dy in sprite_bounds:
                             check_pos = (aligned_x + bound_dx, collision_check_y + bound_dy)
-                            if (not self.world_planner.is_valid_position(check_pos[0], check_pos[1]) or
-                                self.world_planner.is_bedrock_position(check_pos[1])):
+                            if (not is_valid(check_pos[0], check_pos[1]) or
+                                check_pos[1] >= first_bedrock_y):
                                 can_place = False
                                 break
                         
@@ -836,21 +1041,23 @@ class OptimizedBrushManager:
                             if block_data:
                                 # FIXED: Move actual sprite placement down by 2 tiles total to fix rendering position
                                 actual_placement_y = aligned_y + 1
-                                layer_dict[(aligned_x, actual_placement_y)] = block_data.copy()
-                                self.stroke_positions.add((aligned_x, actual_placement_y))
-                                new_positions_this_batch.append((aligned_x, actual_placement_y))
+                                # block_data is already the shared interned
+                                # dict, so alias it instead of copying per tile
+                                layer_dict[(aligned_x, actual_placement_y)] = block_data
+                                stroke_add((aligned_x, actual_placement_y))
+                                new_position((aligned_x, actual_placement_y))
                     else:
                         # Single tile sprite - simple placement with replacement
                         pos = (tile_x, tile_y)
-                        if not self.world_planner.is_bedrock_position(tile_y):
+                        if tile_y < first_bedrock_y:
                             block_data = self.world_planner.create_block_data_from_selected()
                             if block_data:
                                 # Remove existing sprite if any (brush replacement behavior)
                                 if pos in layer_dict:
                                     del layer_dict[pos]
-                                layer_dict[pos] = block_data.copy()
-                                self.stroke_positions.add(pos)
-                                new_positions_this_batch.append(pos)
+                                layer_dict[pos] = block_data
+                                stroke_add(pos)
+                                new_position(pos)
         
         # Simple tracking for final update
         if new_positions_this_batch:
@@ -1053,9 +1260,26 @@ class OptimizedBrushManager:
 
 class OptimizedWorldPlanner:
     """Optimized World Planner with comprehensive performance improvements"""
-    
+
+    # Toolbar block-grid geometry
+    BLOCK_TILE_SIZE = 40
+    BLOCK_TILE_PADDING = 5
+
+    # Scaled toolbar-sprite LRU capacity
+    UI_SPRITE_CACHE_SIZE = 200
+
+    # (button color, text color) per precomputed button color state
+    _BUTTON_COLOR_LUT = {
+        'disabled': ((40, 40, 40), (128, 128, 128)),
+        'update': ((34, 139, 34), (255, 255, 255)),  # Green for updates
+        'category': ((85, 85, 85), (255, 255, 255)),
+        'active': ((0, 102, 204), (255, 255, 255)),
+        'searching': ((0, 120, 215), (255, 255, 255)),
+        'default': ((68, 68, 68), (255, 255, 255)),
+    }
+
     def __init__(self):
-        from constants import Tool, Layer, TileConnection, APP_VERSION
+        from constants import Tool, Layer, TileConnection, BrushShape, APP_VERSION
         # Initialize pygame with optimization hints
         pygame.init()
         pygame.display.set_caption("Crystal Realms World Planner - made by SavageTheUnicorn")
@@ -1119,6 +1343,11 @@ class OptimizedWorldPlanner:
         # Grid and tile settings
         self.tile_size = 16
         self.zoom = 2
+        # Cached per-zoom derivatives: mouse handlers convert screen to tile
+        # coordinates on every motion event, and multiplying by the cached
+        # reciprocal beats re-deriving the product and dividing each time
+        self._effective_tile_size = self.tile_size * self.zoom
+        self._inv_effective_tile_size = 1.0 / self._effective_tile_size
         self.camera_x = 0
         self.camera_y = 0
         
@@ -1126,6 +1355,9 @@ class OptimizedWorldPlanner:
         self.world_width = 301
         self.world_height = 171
         self.bedrock_rows = 6
+        # First bedrock row, cached so per-tile loops compare one int
+        # instead of re-deriving it from two attribute loads
+        self._first_bedrock_y = self.world_height - self.bedrock_rows
         
         # Game state
         self.active_layer = Layer.MIDGROUND
@@ -1138,6 +1370,18 @@ class OptimizedWorldPlanner:
         self.selected_block = None
         self.is_dragging = False
         self.last_mouse_pos = (0, 0)
+
+        # Left-click dispatch table - one dict lookup per canvas click
+        # instead of walking an if/elif chain over every tool
+        self._left_click_handlers = {
+            Tool.SELECT: self._click_select,
+            Tool.PLACE: self._click_place,
+            Tool.BRUSH: self._click_brush,
+            Tool.ERASE: self._click_erase,
+            Tool.FILL: self._click_fill,
+            Tool.PASTE: self._click_paste,
+            Tool.EYEDROPPER: self._click_eyedropper,
+        }
         
         # Selection state
         self.selection = None
@@ -1146,7 +1390,7 @@ class OptimizedWorldPlanner:
         
         # Brush settings
         self.brush_size = 1
-        self.brush_shape = "square"
+        self.brush_shape = BrushShape.SQUARE
         
         # Custom brush size input
         self.is_inputting_brush_size = False
@@ -1187,11 +1431,102 @@ class OptimizedWorldPlanner:
         self.block_buttons = {}
         
         # UI surface caching
-        self.ui_surface_cache = {}
+        self.ui_surface_cache = OrderedDict()
+        self._ui_sprite_cache_cap = self.UI_SPRITE_CACHE_SIZE
         self.ui_cache_dirty = True
+
+        # Signature of the last init_ui build so unchanged UI state skips the rebuild
+        self._ui_signature = None
+
+        # Pooled Rects and category actions reused across init_ui rebuilds
+        self._block_rect_pool = {}
+        self._category_actions = {}
+
+        # Background id -> index map so prev/next don't rescan the list
+        self._bg_index_map = {}
+        self._bg_index_key = None
+
+        # Button actions created once; init_ui references these instead of
+        # allocating fresh closures on every rebuild
+        self._actions = {
+            'layer_bg': partial(self.set_active_layer, Layer.BACKGROUND),
+            'layer_mid': partial(self.set_active_layer, Layer.MIDGROUND),
+            'bg_none': partial(self.set_background, 'none'),
+            'brush_size_1': partial(self.set_brush_size, 1),
+            'brush_size_3': partial(self.set_brush_size, 3),
+            'brush_square': partial(self.set_brush_shape, BrushShape.SQUARE),
+            'brush_circle': partial(self.set_brush_shape, BrushShape.CIRCLE),
+            'prev_state': partial(self._cycle_selected_block_state, -1),
+            'next_state': partial(self._cycle_selected_block_state, 1),
+        }
+
+        # Save encoding and world-file parsing run here so multi-megabyte
+        # JSON work doesn't stall the frame loop
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+
+        # Formatted toolbar labels keyed by name -> (last input, string)
+        self._label_cache = {}
+
+        # Measured text widths keyed by string, for the input cursors
+        self._text_width_cache = {}
+
+        # Debounced UI rebuilds: keystrokes and rapid clicks set the flag and
+        # the frame loop rebuilds at most once per ~16ms
+        self._ui_rebuild_pending = False
+        self._last_ui_build = 0
+
+        # blocks_per_row cache, keyed by the toolbar width it was computed for
+        self._blocks_per_row = 0
+        self._blocks_per_row_width = None
+
+        # Scrollbar rects, keyed by the scroll geometry they were built from
+        self._scrollbar_cache_key = None
+        self._scrollbar_track = None
+        self._scrollbar_thumb = None
+
+        # Scrollbar drag throttling (high-poll mice exceed the frame rate)
+        self._last_scrollbar_update_ms = 0
+        self._pending_scrollbar_pos = None
+
+        # Hover memoization: probe key -> resolved tooltip text, so a
+        # stationary mouse skips the hit-testing entirely
+        self._toolbar_layout_version = 0
+        self._last_hover_probe = None
+        self._last_hover_text = None
+
+        # Canvas hover preview cache; (key, occupied_tiles, has_collision)
+        self._hover_preview_cache = None
+
+        # Locally held scaled background and the inputs it was scaled for
+        self._bg_scale_key = None
+        self._bg_scaled = None
+
+        # Scratch rects reused across toolbar draw loops, so scroll-adjusted
+        # rects don't allocate one Rect per visible button per frame
+        self._scratch_rect = pygame.Rect(0, 0, 0, 0)
+        self._scratch_inner = pygame.Rect(0, 0, 0, 0)
+
+        # Last rendered frame and the state signature it was drawn from;
+        # when the signature repeats, the frame is reblitted instead of redrawn
+        self._last_frame = None
+        self._last_frame_signature = None
+
+        # Rolling frame work times feeding the overlay-degradation predictor
+        self._frame_work_times = deque(maxlen=120)
+        self._predicted_frame_ms = 0.0
+        self._degrade_overlays = False
+
+        # Interned block-data dicts shared across placements of the same block
+        self._block_data_cache = {}
+        self._interned_blocks = {}
+
+        # Lazily-started single worker for flood_fill_async jobs
+        self._flood_queue = None
         
-        # Recent blocks
+        # Recent blocks, with an id-keyed OrderedDict backing the display list
+        # so membership and reordering avoid dict-equality scans
         self.recent_blocks = []
+        self._recent_ids = OrderedDict()
         
         # Search functionality
         self.search_text = ""
@@ -1312,17 +1647,20 @@ class OptimizedWorldPlanner:
         bedrock_rows = 6
         start_row = self.world_height - bedrock_rows
         
-        for y in range(start_row, self.world_height):
-            for x in range(self.world_width):
-                self.layers[Layer.MIDGROUND][(x, y)] = block_data.copy()
-        
+        # Share one dict across all bedrock tiles - placed block dicts are never
+        # mutated per-tile (state cycling only touches palette blocks), so the
+        # 1800 identical copies were pure allocation churn. A single dict.update
+        # replaces per-key assignments with one C-level merge.
+        batch = {(x, y): block_data
+                 for y in range(start_row, self.world_height)
+                 for x in range(self.world_width)}
+        self.layers[Layer.MIDGROUND].update(batch)
+
         print(f"Placed {bedrock_block['id']} bedrock in bottom {bedrock_rows} rows")
-        
-        # Force chunk refresh in bedrock area
+
+        # Force chunk refresh in bedrock area with a single region invalidation
         if hasattr(self, 'chunk_manager') and self.chunk_manager is not None:
-            for y in range(start_row, self.world_height, self.chunk_manager.chunk_size):
-                for x in range(0, self.world_width, self.chunk_manager.chunk_size):
-                    self.chunk_manager.invalidate_chunk(x, y)
+            self.chunk_manager.invalidate_region(0, start_row, self.world_width - 1, self.world_height - 1)
 
     def save_state_for_undo(self, description: str):
         """Save current state for undo functionality"""
@@ -1343,7 +1681,7 @@ class OptimizedWorldPlanner:
             
             # FIXED: Invalidate all chunks like clear_world does
             self.chunk_manager.invalidate_all_chunks()
-            self.init_ui()
+            self._schedule_ui_rebuild()
 
     def invalidate_brush_cache(self):
         """Invalidate brush spatial index when world changes significantly"""
@@ -1389,47 +1727,68 @@ class OptimizedWorldPlanner:
         if self.tile_renderer.check_placement_collision(self, tile_x, tile_y, block_data, self.active_layer):
             return False
         
-        # Place the block at origin position
-        placed_block_data = block_data.copy()
+        # Place the block at origin position (canonical shared dict)
+        placed_block_data = self._intern_block(block_data)
         self.layers[self.active_layer][(tile_x, tile_y)] = placed_block_data
         
         # Clear selection after any block placement
         if self.selection:
             self.selection = None
             self.selection_start = None
-            self.init_ui()
+            self._schedule_ui_rebuild()
         
         # Get all tiles this sprite occupies and invalidate chunks
         sprite = self.block_manager.get_sprite(block_data.get('id', ''))
         occupied_tiles = self.tile_renderer.get_sprite_occupied_tiles(tile_x, tile_y, block_data, sprite)
         
         # FIXED: Force immediate chunk invalidation and reset cache state
-        invalidated_chunks = set()
-        for occupied_x, occupied_y in occupied_tiles:
-            if self.is_valid_position(occupied_x, occupied_y):
-                chunk_key = self.chunk_manager.get_chunk_key(occupied_x, occupied_y)
-                if chunk_key not in invalidated_chunks:
-                    chunk = self.chunk_manager.get_or_create_chunk(chunk_key[0], chunk_key[1])
-                    chunk.dirty = True
-                    chunk.blocks_hash = None  # Force hash recalculation
-                    chunk.last_zoom = None   # Force zoom recalculation
-                    chunk.surface = None     # Force surface recreation
-                    invalidated_chunks.add(chunk_key)
-        
-        # Also invalidate neighboring chunks for seamless tiling
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                neighbor_x, neighbor_y = tile_x + dx, tile_y + dy
-                if self.is_valid_position(neighbor_x, neighbor_y):
-                    chunk_key = self.chunk_manager.get_chunk_key(neighbor_x, neighbor_y)
-                    if chunk_key not in invalidated_chunks:
-                        chunk = self.chunk_manager.get_or_create_chunk(chunk_key[0], chunk_key[1])
-                        chunk.dirty = True
-                        chunk.blocks_hash = None
-                        invalidated_chunks.add(chunk_key)
-        
+        invalidated = self._invalidate_chunks_for_tiles(occupied_tiles, reset_zoom_and_surface=True)
+
+        # Also invalidate neighboring chunks for seamless tiling. The 3x3 tile
+        # neighborhood spans at most 4 chunks, so walk the chunk-space range
+        # directly instead of expanding all 9 tile offsets
+        chunk_size = self.chunk_manager.chunk_size
+        get_or_create_chunk = self.chunk_manager.get_or_create_chunk
+        chunk_x0 = max(tile_x - 1, 0) // chunk_size
+        chunk_x1 = min(tile_x + 1, self.world_width - 1) // chunk_size
+        chunk_y0 = max(tile_y - 1, 0) // chunk_size
+        chunk_y1 = min(tile_y + 1, self.world_height - 1) // chunk_size
+        for chunk_y in range(chunk_y0, chunk_y1 + 1):
+            for chunk_x in range(chunk_x0, chunk_x1 + 1):
+                if (chunk_x, chunk_y) in invalidated:
+                    continue
+                chunk = get_or_create_chunk(chunk_x, chunk_y)
+                chunk.dirty = True
+                chunk.blocks_hash = None
+
         return True
 
+    def _invalidate_chunks_for_tiles(self, tiles, reset_zoom_and_surface=False):
+        """Invalidate the unique chunks covering an iterable of tile positions.
+
+        Deduplicates through a set of chunk keys first, so a multi-tile sprite
+        costs one chunk lookup per touched chunk instead of one per tile.
+        """
+        chunk_size = self.chunk_manager.chunk_size
+        world_width = self.world_width
+        world_height = self.world_height
+
+        chunk_keys = {(x // chunk_size, y // chunk_size)
+                      for x, y in tiles
+                      if 0 <= x < world_width and 0 <= y < world_height}
+
+        self._hover_preview_cache = None
+
+        get_or_create_chunk = self.chunk_manager.get_or_create_chunk
+        for chunk_x, chunk_y in chunk_keys:
+            chunk = get_or_create_chunk(chunk_x, chunk_y)
+            chunk.dirty = True
+            chunk.blocks_hash = None  # Force hash recalculation
+            if reset_zoom_and_surface:
+                chunk.last_zoom = None  # Force zoom recalculation
+                chunk.surface = None    # Force surface recreation
+        return chunk_keys
+
     def erase_block_at_position(self, tile_x, tile_y):
         """Erase any sprite that occupies the given position"""
         if not self.is_valid_position(tile_x, tile_y):
@@ -1455,22 +1814,74 @@ class OptimizedWorldPlanner:
             del self.layers[self.active_layer][origin_pos]
         
         # FIXED: Force immediate chunk invalidation for all previously occupied tiles
-        invalidated_chunks = set()
-        for occupied_x, occupied_y in occupied_tiles:
-            if self.is_valid_position(occupied_x, occupied_y):
-                chunk_key = self.chunk_manager.get_chunk_key(occupied_x, occupied_y)
-                if chunk_key not in invalidated_chunks:
-                    chunk = self.chunk_manager.get_or_create_chunk(chunk_key[0], chunk_key[1])
-                    chunk.dirty = True  # Force dirty flag
-                    chunk.blocks_hash = None  # Reset hash to force re-computation
-                    invalidated_chunks.add(chunk_key)
-        
+        self._invalidate_chunks_for_tiles(occupied_tiles)
+
         return True
 
     def check_sprite_collision(self, tile_x, tile_y, block_data, layer):
         """Check if placing a sprite would collide with existing sprites"""
         return self.tile_renderer.check_placement_collision(self, tile_x, tile_y, block_data, layer)
 
+    @property
+    def blocks_per_row(self):
+        """Blocks per toolbar row; recomputed only when the toolbar width changes"""
+        if self._blocks_per_row_width != self.toolbar_width:
+            self._blocks_per_row_width = self.toolbar_width
+            self._blocks_per_row = ((self.toolbar_width - 20)
+                                    // (self.BLOCK_TILE_SIZE + self.BLOCK_TILE_PADDING))
+        return self._blocks_per_row
+
+    def _schedule_ui_rebuild(self):
+        """Request a toolbar rebuild, coalesced by the frame loop"""
+        self._ui_rebuild_pending = True
+
+    def _cached_label(self, key, value, template):
+        """Reuse the formatted label string while its input is unchanged"""
+        cached = self._label_cache.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        text = template.format(value)
+        self._label_cache[key] = (value, text)
+        return text
+
+    def _ui_state_signature(self):
+        """Signature of everything init_ui reads; rebuild only when it changes"""
+        selected = self.selected_block
+        selected_sig = None
+        if selected:
+            selected_sig = (selected.get('id'), selected.get('category'),
+                            selected.get('state'), selected.get('stateCount'),
+                            selected.get('tileMode'))
+        update_sig = None
+        if (hasattr(self, 'update_manager') and
+            self.update_manager is not None and
+            self.update_manager.update_available):
+            update_sig = self.update_manager.latest_version
+        return (
+            self.active_tool,
+            self.selection is not None,
+            self.selection_start is not None,
+            self.undo_manager.can_undo(),
+            self.undo_manager.get_undo_description(),
+            self.undo_manager.can_redo(),
+            self.undo_manager.get_redo_description(),
+            self.active_layer,
+            self.background_manager.current_background,
+            self.background_manager.get_current_background_name(),
+            self.brush_size,
+            self.brush_shape,
+            self.is_inputting_brush_size,
+            self.custom_brush_text,
+            selected_sig,
+            update_sig,
+            self.search_text,
+            tuple((b.get('id'), b.get('state')) for b in self.recent_blocks),
+            tuple(sorted(self.category_expanded.items())),
+            self.block_manager.blocks_version,
+            self.toolbar_width,
+            self.screen_height,
+        )
+
     def init_ui(self):
         """Initialize the UI components with caching optimizations"""
         # Clear selection only if not using select or paste tool
@@ -1478,7 +1889,13 @@ class OptimizedWorldPlanner:
             if self.selection is not None or self.selection_start is not None:
                 self.selection = None
                 self.selection_start = None
-        
+
+        # Skip the full rebuild when nothing the toolbar shows has changed
+        signature = self._ui_state_signature()
+        if signature == self._ui_signature:
+            return
+        self._ui_signature = signature
+
         # Reset buttons
         self.buttons = {}
         self.toolbuttons = {}
@@ -1577,14 +1994,14 @@ class OptimizedWorldPlanner:
             'rect': pygame.Rect(10, button_y, layer_button_width, 30),
             'text': 'Background',
             'active': self.active_layer == Layer.BACKGROUND,
-            'action': lambda: self.set_active_layer(Layer.BACKGROUND)
+            'action': self._actions['layer_bg']
         }
     
         self.buttons['layer_mid'] = {
             'rect': pygame.Rect(20 + layer_button_width, button_y, layer_button_width, 30),
             'text': 'Foreground',
             'active': self.active_layer == Layer.MIDGROUND,
-            'action': lambda: self.set_active_layer(Layer.MIDGROUND)
+            'action': self._actions['layer_mid']
         }
     
         button_y += 40
@@ -1592,7 +2009,9 @@ class OptimizedWorldPlanner:
         # WORLD BACKGROUND CONTROLS
         self.buttons['background_label'] = {
             'rect': pygame.Rect(10, button_y, self.toolbar_width - 20, 25),
-            'text': f'World Background: {self.background_manager.get_current_background_name()}'
+            'text': self._cached_label('background',
+                                       self.background_manager.get_current_background_name(),
+                                       'World Background: {}')
         }
         button_y += 35
     
@@ -1608,7 +2027,7 @@ class OptimizedWorldPlanner:
         self.buttons['bg_none'] = {
             'rect': pygame.Rect(15 + bg_button_width, button_y, bg_button_width, 30),
             'text': 'None',
-            'action': lambda: self.set_background('none'),
+            'action': self._actions['bg_none'],
             'active': self.background_manager.current_background == 'none'
         }
         
@@ -1624,7 +2043,7 @@ class OptimizedWorldPlanner:
         if self.active_tool == Tool.BRUSH or self.active_tool == Tool.ERASE:
             self.buttons['brush_size_label'] = {
                 'rect': pygame.Rect(10, button_y, self.toolbar_width - 20, 30),
-                'text': f'Brush Size: {self.brush_size}'
+                'text': self._cached_label('brush_size', self.brush_size, 'Brush Size: {}')
             }
             button_y += 40
     
@@ -1636,7 +2055,7 @@ class OptimizedWorldPlanner:
                 self.buttons[f'brush_size_{size}'] = {
                     'rect': pygame.Rect(x, button_y, size_button_width, 30),
                     'text': str(size),
-                    'action': lambda s=size: self.set_brush_size(s),
+                    'action': self._actions[f'brush_size_{size}'],
                     'active': self.brush_size == size
                 }
     
@@ -1656,15 +2075,15 @@ class OptimizedWorldPlanner:
             self.buttons['brush_square'] = {
                 'rect': pygame.Rect(10, button_y, layer_button_width, 30),
                 'text': 'Square',
-                'action': lambda: self.set_brush_shape('square'),
-                'active': self.brush_shape == 'square'
+                'action': self._actions['brush_square'],
+                'active': self.brush_shape == BrushShape.SQUARE
             }
     
             self.buttons['brush_circle'] = {
                 'rect': pygame.Rect(20 + layer_button_width, button_y, layer_button_width, 30),
                 'text': 'Circle',
-                'action': lambda: self.set_brush_shape('circle'),
-                'active': self.brush_shape == 'circle'
+                'action': self._actions['brush_circle'],
+                'active': self.brush_shape == BrushShape.CIRCLE
             }
     
             button_y += 40
@@ -1728,13 +2147,13 @@ class OptimizedWorldPlanner:
                 self.buttons['prev_state'] = {
                     'rect': pygame.Rect(10, button_y, (self.toolbar_width - 30) // 2, 30),
                     'text': "< Prev",
-                    'action': lambda: self.cycle_block_state(self.selected_block, -1)
+                    'action': self._actions['prev_state']
                 }
                 
                 self.buttons['next_state'] = {
                     'rect': pygame.Rect(20 + (self.toolbar_width - 30) // 2, button_y, (self.toolbar_width - 30) // 2, 30),
                     'text': "Next >",
-                    'action': lambda: self.cycle_block_state(self.selected_block, 1)
+                    'action': self._actions['next_state']
                 }
                 button_y += 40
     
@@ -1752,7 +2171,8 @@ class OptimizedWorldPlanner:
             self.update_manager.update_available):
             self.buttons['update_available'] = {
                 'rect': pygame.Rect(10, button_y, self.toolbar_width - 20, 30),
-                'text': f'Update to version {self.update_manager.latest_version}',
+                'text': self._cached_label('update', self.update_manager.latest_version,
+                                           'Update to version {}'),
                 'action': self.install_update,
                 'update_button': True
             }
@@ -1760,7 +2180,7 @@ class OptimizedWorldPlanner:
     
         self.buttons['search_bar'] = {
             'rect': pygame.Rect(10, button_y, self.toolbar_width - 20, 30),
-            'text': f'Search: {self.search_text}',
+            'text': self._cached_label('search', self.search_text, 'Search: {}'),
             'action': self.activate_search,
             'is_search': True
         }
@@ -1776,13 +2196,12 @@ class OptimizedWorldPlanner:
     
             button_y += 40
     
-            block_size = 40
-            padding = 5
-            blocks_per_row = (self.toolbar_width - 20) // (block_size + padding)
-    
+            block_size = self.BLOCK_TILE_SIZE
+            padding = self.BLOCK_TILE_PADDING
+            blocks_per_row = self.blocks_per_row
+
             for j, block in enumerate(self.recent_blocks):
-                row = j // blocks_per_row
-                col = j % blocks_per_row
+                row, col = divmod(j, blocks_per_row)
     
                 x = 10 + col * (block_size + padding)
                 y = button_y + row * (block_size + padding)
@@ -1807,7 +2226,7 @@ class OptimizedWorldPlanner:
             
             self.buttons['tiling_info'] = {
                 'rect': pygame.Rect(10, button_y, self.toolbar_width - 20, 30),
-                'text': f"Tiling Mode: {mode_name}"
+                'text': self._cached_label('tiling_mode', mode_name, 'Tiling Mode: {}')
             }
             button_y += 40
     
@@ -1818,20 +2237,96 @@ class OptimizedWorldPlanner:
         # Mark UI cache as dirty after changes
         self.ui_cache_dirty = True
 
+        # Rebuild the y-sorted hit-test index to match the new layout
+        self._build_toolbar_hit_index()
+
+        # Scale button sprites now, off the draw path
+        self._prewarm_button_sprites()
+
+    def _build_toolbar_hit_index(self):
+        """Build a flat y-sorted index over all toolbar buttons for bisect hit-testing"""
+        entries = []
+        for name, button_data in self.buttons.items():
+            rect = button_data['rect']
+            entries.append((rect.top, rect.bottom, rect, 'button', (name, button_data)))
+            # Stamp the draw color state here so the per-frame draw loop is a
+            # plain LUT lookup; the text-input highlight stays dynamic
+            if not button_data.get('enabled', True):
+                button_data['_color_state'] = 'disabled'
+            elif button_data.get('update_button', False):
+                button_data['_color_state'] = 'update'
+            elif name.startswith('category_'):
+                button_data['_color_state'] = 'category'
+            elif button_data.get('active', False):
+                button_data['_color_state'] = 'active'
+            else:
+                button_data['_color_state'] = 'default'
+        for tool, button_data in self.toolbuttons.items():
+            rect = button_data['rect']
+            entries.append((rect.top, rect.bottom, rect, 'tool', (tool, button_data)))
+        visible_blocks = []
+        for category, blocks in self.block_buttons.items():
+            if not self.category_expanded.get(category, True):
+                continue
+            for block_btn in blocks:
+                rect = block_btn['rect']
+                entries.append((rect.top, rect.bottom, rect, 'block', (category, block_btn)))
+                visible_blocks.append(block_btn)
+        self._visible_block_buttons = visible_blocks
+        # Let the sprite LRU hold at least one scaled surface per visible
+        # block so a full toolbar can't thrash its own working set
+        self._ui_sprite_cache_cap = max(self.UI_SPRITE_CACHE_SIZE,
+                                        len(visible_blocks) + 32)
+        entries.sort(key=lambda e: e[0])
+        self._toolbar_hit_index = entries
+        self._toolbar_hit_tops = [e[0] for e in entries]
+        self._toolbar_content_bottom = max((e[1] for e in entries), default=0)
+        self._toolbar_layout_version += 1
+
+    # Tallest toolbar button is 40px; entries whose top is further above the
+    # probe point than this can never contain it, so the backward scan stops
+    _TOOLBAR_ROW_MAX_HEIGHT = 48
+
+    def _toolbar_hits_at(self, adjusted_pos):
+        """Return (kind, payload) toolbar entries under adjusted_pos via bisect on button tops"""
+        y = adjusted_pos[1]
+        tops = self._toolbar_hit_tops
+        entries = self._toolbar_hit_index
+        hits = []
+        for j in range(bisect_right(tops, y) - 1, -1, -1):
+            top, bottom, rect, kind, payload = entries[j]
+            if top <= y - self._TOOLBAR_ROW_MAX_HEIGHT:
+                break
+            if y < bottom and rect.collidepoint(adjusted_pos):
+                hits.append((kind, payload))
+        return hits
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _state_text(state, state_count):
+        return f"State: {state + 1}/{state_count}"
+
     def get_state_display_text(self, block):
         """Get display text for the current state of a multi-state block"""
         if 'state' in block and 'stateCount' in block:
-            state = block.get('state', 0)
-            state_count = block.get('stateCount', 2)
-            return f"State: {state + 1}/{state_count}"
+            return self._state_text(block.get('state', 0), block.get('stateCount', 2))
         return ""
 
+    @lru_cache(maxsize=128)
+    def _filter_blocks(self, category, search_lower, blocks_version):
+        """Cached search filter; blocks_version keys out stale results"""
+        blocks = self.block_manager.get_blocks_by_category(category)
+        return tuple(b['id'] for b in blocks
+                     if search_lower in b['id'].lower()
+                     or search_lower in b['name'].lower())
+
     def add_block_categories(self, button_y):
         """Add block categories to the toolbar with optimizations"""
         category_order = ['custom']
-        
+
         self.block_buttons = {}
-        
+        rect_pool = self._block_rect_pool
+
         for category in category_order:
             if category not in self.block_manager.blocks:
                 continue
@@ -1839,10 +2334,15 @@ class OptimizedWorldPlanner:
             if category not in self.category_expanded:
                 self.category_expanded[category] = True
 
+            action = self._category_actions.get(category)
+            if action is None:
+                action = self._category_actions[category] = \
+                    lambda cat=category: self.toggle_category(cat)
+
             self.buttons[f'category_{category}'] = {
                 'rect': pygame.Rect(10, button_y, self.toolbar_width - 20, 30),
                 'text': category.capitalize() + ' Blocks',
-                'action': lambda cat=category: self.toggle_category(cat),
+                'action': action,
                 'category': category
             }
 
@@ -1856,26 +2356,33 @@ class OptimizedWorldPlanner:
             if self.category_expanded.get(category, True):
                 blocks = self.block_manager.get_blocks_by_category(category)
                 filtered_blocks = blocks
-                
+
                 if self.search_text:
-                    search_lower = self.search_text.lower()
-                    filtered_blocks = [b for b in blocks
-                                     if search_lower in b['id'].lower()
-                                     or search_lower in b['name'].lower()]
+                    matched_ids = self._filter_blocks(category, self.search_text.lower(),
+                                                      self.block_manager.blocks_version)
+                    by_id = {b['id']: b for b in blocks}
+                    filtered_blocks = [by_id[block_id] for block_id in matched_ids
+                                       if block_id in by_id]
 
-                block_size = 40
-                padding = 5
-                blocks_per_row = (self.toolbar_width - 20) // (block_size + padding)
+                block_size = self.BLOCK_TILE_SIZE
+                padding = self.BLOCK_TILE_PADDING
+                blocks_per_row = self.blocks_per_row
 
                 for j, block in enumerate(filtered_blocks):
-                    row = j // blocks_per_row
-                    col = j % blocks_per_row
+                    row, col = divmod(j, blocks_per_row)
 
                     x = 10 + col * (block_size + padding)
                     y = button_y + row * (block_size + padding)
 
+                    # Reuse the pooled Rect for this slot instead of allocating
+                    rect = rect_pool.get((category, j))
+                    if rect is None:
+                        rect = rect_pool[(category, j)] = pygame.Rect(x, y, block_size, block_size)
+                    else:
+                        rect.update(x, y, block_size, block_size)
+
                     self.block_buttons[category].append({
-                        'rect': pygame.Rect(x, y, block_size, block_size),
+                        'rect': rect,
                         'block': block,
                         'selected': block == self.selected_block
                     })
@@ -1888,7 +2395,7 @@ class OptimizedWorldPlanner:
     def toggle_category(self, category):
         """Toggle category expansion state"""
         self.category_expanded[category] = not self.category_expanded.get(category, True)
-        self.init_ui()
+        self._schedule_ui_rebuild()
 
     def toggle_grid(self):
         """Toggle grid visibility"""
@@ -1903,17 +2410,18 @@ class OptimizedWorldPlanner:
     def set_brush_size(self, size):
         """Set the brush size"""
         self.brush_size = size
-        self.init_ui()
+        self._schedule_ui_rebuild()
 
     def set_brush_shape(self, shape):
         """Set the brush shape"""
         self.brush_shape = shape
-        self.init_ui()
+        self._schedule_ui_rebuild()
 
     def set_active_layer(self, layer):
         """Set the active layer and update UI"""
         self.active_layer = layer
-        self.init_ui()
+        self._hover_preview_cache = None
+        self._schedule_ui_rebuild()
 
     def activate_search(self):
         """Activate the search bar for input"""
@@ -1925,42 +2433,55 @@ class OptimizedWorldPlanner:
         self.is_inputting_brush_size = True
         self.custom_brush_text = str(self.brush_size) if self.brush_size not in [1, 3] else ""
         self.custom_brush_cursor_pos = len(self.custom_brush_text)
-        self.init_ui()
+        self._schedule_ui_rebuild()
+
+    def get_world_pixel_size(self):
+        """Current world size in screen pixels (the scaled-background target size)"""
+        effective_tile_size = int(self.tile_size * self.zoom)
+        return (self.world_width * effective_tile_size, self.world_height * effective_tile_size)
+
+    def _background_index_map(self, bg_list):
+        """Id -> index lookup for the background list, rebuilt when it changes"""
+        key = (id(bg_list), len(bg_list))
+        if key != self._bg_index_key:
+            self._bg_index_map = {bg['id']: i for i, bg in enumerate(bg_list)}
+            self._bg_index_key = key
+        return self._bg_index_map
 
     def previous_background(self):
         """Switch to the previous background"""
         bg_list = self.background_manager.get_background_list()
         if len(bg_list) <= 1:
             return
-        
+
         current_id = self.background_manager.current_background
-        current_index = next((i for i, bg in enumerate(bg_list) if bg['id'] == current_id), 0)
-        
+        current_index = self._background_index_map(bg_list).get(current_id, 0)
+
         new_index = (current_index - 1) % len(bg_list)
         new_bg_id = bg_list[new_index]['id']
-        
-        self.background_manager.set_current_background(new_bg_id)
-        self.init_ui()
+
+        self.background_manager.set_current_background(new_bg_id, self.get_world_pixel_size())
+        self._schedule_ui_rebuild()
 
     def next_background(self):
         """Switch to the next background"""
         bg_list = self.background_manager.get_background_list()
         if len(bg_list) <= 1:
             return
-        
+
         current_id = self.background_manager.current_background
-        current_index = next((i for i, bg in enumerate(bg_list) if bg['id'] == current_id), 0)
-        
+        current_index = self._background_index_map(bg_list).get(current_id, 0)
+
         new_index = (current_index + 1) % len(bg_list)
         new_bg_id = bg_list[new_index]['id']
-        
-        self.background_manager.set_current_background(new_bg_id)
-        self.init_ui()
+
+        self.background_manager.set_current_background(new_bg_id, self.get_world_pixel_size())
+        self._schedule_ui_rebuild()
 
     def set_background(self, bg_id):
         """Set a specific background by ID"""
-        self.background_manager.set_current_background(bg_id)
-        self.init_ui()
+        self.background_manager.set_current_background(bg_id, self.get_world_pixel_size())
+        self._schedule_ui_rebuild()
 
     def save_world(self):
         """Save world data to a JSON file"""
@@ -1978,25 +2499,94 @@ class OptimizedWorldPlanner:
             
             if file_path:
                 save_data = {
-                    'layers': {},
+                    'layers': self._build_save_layers(),
                     'world_width': self.world_width,
                     'world_height': self.world_height,
                     'bedrock_rows': self.bedrock_rows,
                     'background': self.background_manager.current_background
                 }
 
-                for layer_enum, layer_dict in self.layers.items():
-                    layer_name = layer_enum.name
-                    save_data['layers'][layer_name] = {}
+                self._io_executor.submit(self._write_save_job, save_data, file_path)
+        except Exception as e:
+            print(f"Error saving world: {e}")
 
-                    for pos, block_data in layer_dict.items():
-                        save_data['layers'][layer_name][f"{pos[0]},{pos[1]}"] = block_data
+    def _write_save_job(self, save_data, file_path):
+        """Encode and write a save on the I/O executor
 
-                with open(file_path, 'w') as f:
-                    json.dump(save_data, f)
-                print(f"World saved to {file_path}")
+        save_data snapshots the layer contents into fresh lists on the main
+        thread before submission, so the worker never iterates a dict the
+        frame loop might mutate.
+        """
+        try:
+            self._write_save_file(save_data, file_path)
+            print(f"World saved to {file_path}")
         except Exception as e:
             print(f"Error saving world: {e}")
+
+    def _intern_block(self, block_data):
+        """Canonical shared dict for the given block metadata.
+
+        Batch placement paths historically allocated a defensive copy per
+        tile. Placed dicts are never mutated in place (state cycling edits
+        the palette definition, not placed blocks), so every tile with
+        identical metadata can alias one canonical dict instead.
+        """
+        key = _freeze(block_data)
+        shared = self._interned_blocks.get(key)
+        if shared is None:
+            shared = dict(block_data)
+            self._interned_blocks[key] = shared
+        return shared
+
+    def _intern_layer_blocks(self, layers):
+        """Hash-cons block dicts so identical blocks share one allocation
+
+        JSON loading allocates a fresh dict per placed block even though a
+        large world typically uses a handful of distinct block definitions.
+        Re-point duplicate positions at one shared dict, restoring the same
+        flyweight sharing create_block_data_from_selected gives new
+        placements. Placed dicts are never mutated per-tile, so aliasing is
+        safe (same audit as the interning cache).
+        """
+        table = {}
+        for layer_dict in layers.values():
+            for pos, block_data in layer_dict.items():
+                key = _freeze(block_data)
+                shared = table.get(key)
+                if shared is None:
+                    table[key] = block_data
+                else:
+                    layer_dict[pos] = shared
+
+        # Warm the occupied-tile offsets for every distinct loaded block so
+        # find_sprite_at_position's probe window covers them immediately
+        for block_data in table.values():
+            self.tile_renderer.get_sprite_occupied_tiles(0, 0, block_data)
+
+    def _build_save_layers(self):
+        """Layers as parallel xs/ys/blocks arrays, one entry per placed block
+
+        Avoids allocating an "x,y" key string per block; load_world accepts
+        both this layout and the legacy stringified-key dicts.
+        """
+        layers = {}
+        for layer_enum, layer_dict in self.layers.items():
+            items = list(layer_dict.items())
+            layers[layer_enum.name] = {
+                'xs': [pos[0] for pos, _ in items],
+                'ys': [pos[1] for pos, _ in items],
+                'blocks': [block_data for _, block_data in items]
+            }
+        return layers
+
+    def _write_save_file(self, save_data, file_path):
+        """Serialize with orjson's C encoder when available, stdlib json otherwise"""
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(save_data))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(save_data, f)
             
     def perform_autosave(self):
         """Perform an autosave operation"""
@@ -2012,7 +2602,7 @@ class OptimizedWorldPlanner:
             
             # Use existing save logic
             save_data = {
-                'layers': {},
+                'layers': self._build_save_layers(),
                 'world_width': self.world_width,
                 'world_height': self.world_height,
                 'bedrock_rows': self.bedrock_rows,
@@ -2020,18 +2610,10 @@ class OptimizedWorldPlanner:
                 'autosave': True,
                 'timestamp': timestamp
             }
-    
-            for layer_enum, layer_dict in self.layers.items():
-                layer_name = layer_enum.name
-                save_data['layers'][layer_name] = {}
-    
-                for pos, block_data in layer_dict.items():
-                    save_data['layers'][layer_name][f"{pos[0]},{pos[1]}"] = block_data
-    
-            with open(filepath, 'w') as f:
-                json.dump(save_data, f)
-            
-            print(f"Autosaved to {filepath}")
+
+            self._io_executor.submit(self._write_save_job, save_data, filepath)
+
+            print(f"Autosaving to {filepath}")
             
             # Clean up old autosave files
             self.cleanup_old_autosaves()
@@ -2074,21 +2656,34 @@ class OptimizedWorldPlanner:
         """Create block data from the currently selected block"""
         if not self.selected_block:
             return None
-            
-        block_data = {
-            'id': self.selected_block['id'],
-            'category': self.selected_block.get('category', 'custom'),
-            'isBackground': self.selected_block.get('isBackground', False),
-            'tileSet': self.selected_block.get('tileSet', False),
-            'tileMode': self.selected_block.get('tileMode', 'standard'),
-            'tileable': self.selected_block.get('tileable', {})
-        }
-        
-        if 'state' in self.selected_block:
-            block_data['state'] = self.selected_block['state']
-            if 'stateCount' in self.selected_block:
-                block_data['stateCount'] = self.selected_block['stateCount']
-        
+
+        # Flyweight interning: every tile placed with the same palette block
+        # shares one metadata dict instead of allocating a fresh ~500-byte dict
+        # per placement. Placed dicts are never mutated per-tile, so aliasing
+        # is safe (same audit as the shared bedrock dict).
+        sb = self.selected_block
+        sb_get = sb.get
+        cache_key = (
+            sb['id'],
+            sb_get('category', 'custom'),
+            sb_get('isBackground', False),
+            sb_get('tileSet', False),
+            sb_get('tileMode', 'standard'),
+            sb_get('state'),
+            sb_get('stateCount')
+        )
+        block_data = self._block_data_cache.get(cache_key)
+        if block_data is not None:
+            return block_data
+
+        block_data = {key: sb_get(key, default) for key, default in _BLOCK_DATA_FIELDS}
+
+        if 'state' in sb:
+            block_data['state'] = sb['state']
+            if 'stateCount' in sb:
+                block_data['stateCount'] = sb['stateCount']
+
+        self._block_data_cache[cache_key] = block_data
         return block_data
 
     def load_world(self):
@@ -2105,38 +2700,66 @@ class OptimizedWorldPlanner:
             root.destroy()
             
             if file_path:
-                with open(file_path, 'r') as f:
-                    save_data = json.load(f)
+                # Parse off-thread; _apply_loaded_world runs when the event
+                # loop picks up WORLD_LOADED_EVENT
+                self._io_executor.submit(self._parse_world_job, file_path)
 
-                self.layers = {
-                    Layer.BACKGROUND: {},
-                    Layer.MIDGROUND: {}
-                }
+        except Exception as e:
+            print(f"Error loading world: {e}")
 
-                if 'layers' in save_data:
-                    self.world_width = save_data.get('world_width', self.world_width)
-                    self.world_height = save_data.get('world_height', self.world_height)
-                    self.bedrock_rows = save_data.get('bedrock_rows', self.bedrock_rows)
-                    
-                    saved_background = save_data.get('background')
-                    if saved_background:
-                        self.background_manager.set_current_background(saved_background)
-
-                    for layer_name, layer_dict in save_data['layers'].items():
-                        if layer_name in ['BACKGROUND', 'MIDGROUND']:
-                            layer_enum = Layer[layer_name]
-                            for pos_str, block_data in layer_dict.items():
+    def _parse_world_job(self, file_path):
+        """Read and parse a world file on the I/O executor"""
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            save_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            pygame.event.post(pygame.event.Event(
+                WORLD_LOADED_EVENT, save_data=save_data, file_path=file_path))
+        except Exception as e:
+            print(f"Error loading world: {e}")
+
+    def _apply_loaded_world(self, save_data, file_path):
+        """Apply a parsed world on the main thread"""
+        try:
+            self.layers = {
+                Layer.BACKGROUND: {},
+                Layer.MIDGROUND: {}
+            }
+
+            if 'layers' in save_data:
+                self.world_width = save_data.get('world_width', self.world_width)
+                self.world_height = save_data.get('world_height', self.world_height)
+                self.bedrock_rows = save_data.get('bedrock_rows', self.bedrock_rows)
+                self._first_bedrock_y = self.world_height - self.bedrock_rows
+
+                saved_background = save_data.get('background')
+                if saved_background:
+                    self.background_manager.set_current_background(saved_background)
+
+                for layer_name, layer_data in save_data['layers'].items():
+                    if layer_name in ['BACKGROUND', 'MIDGROUND']:
+                        layer_enum = Layer[layer_name]
+                        if 'blocks' in layer_data and 'xs' in layer_data:
+                            # Parallel-array layout written by _build_save_layers
+                            self.layers[layer_enum] = dict(zip(
+                                zip(layer_data['xs'], layer_data['ys']),
+                                layer_data['blocks']))
+                        else:
+                            # Legacy "x,y"-keyed layout
+                            for pos_str, block_data in layer_data.items():
                                 x, y = map(int, pos_str.split(','))
                                 self.layers[layer_enum][(x, y)] = block_data
 
-                print(f"World loaded from {file_path}")
-                self.chunk_manager.invalidate_all_chunks()
-                
-                self.undo_manager.clear_history()
-                self.undo_manager.save_state(self.layers, f"Loaded from {os.path.basename(file_path)}")
-                self.init_ui()
-                self.invalidate_brush_cache()
-                
+            self._intern_layer_blocks(self.layers)
+
+            print(f"World loaded from {file_path}")
+            self.chunk_manager.invalidate_all_chunks()
+
+            self.undo_manager.clear_history()
+            self.undo_manager.save_state(self.layers, f"Loaded from {os.path.basename(file_path)}")
+            self._schedule_ui_rebuild()
+            self.invalidate_brush_cache()
+
         except Exception as e:
             print(f"Error loading world: {e}")
 
@@ -2177,21 +2800,59 @@ class OptimizedWorldPlanner:
                             layer_blocks.append(((x, y), block_data))
                     
                     # Sort blocks for proper rendering order (same as chunk manager)
-                    sorted_blocks = sorted(layer_blocks, key=lambda item: (
-                        0 if item[1].get('isBackground', False) else 1,  # Background sprites first
-                        0 if item[1].get('isBedrock', False) else 1,     # Bedrock sprites first
-                        -item[0][1]  # Reverse Y for proper sprite layering (higher tiles on top)
-                    ))
+                    if np is not None and len(layer_blocks) >= 256:
+                        # Vectorized sort keys; lexsort is stable and treats the
+                        # last key as primary, matching the tuple key below
+                        count = len(layer_blocks)
+                        ys = np.fromiter((pos[1] for pos, _ in layer_blocks),
+                                         dtype=np.int32, count=count)
+                        is_bg = np.fromiter(
+                            (0 if bd.get('isBackground', False) else 1 for _, bd in layer_blocks),
+                            dtype=np.int8, count=count)
+                        is_bedrock = np.fromiter(
+                            (0 if bd.get('isBedrock', False) else 1 for _, bd in layer_blocks),
+                            dtype=np.int8, count=count)
+                        order = np.lexsort((-ys, is_bedrock, is_bg))
+                        sorted_blocks = [layer_blocks[i] for i in order]
+                    else:
+                        sorted_blocks = sorted(layer_blocks, key=lambda item: (
+                            0 if item[1].get('isBackground', False) else 1,  # Background sprites first
+                            0 if item[1].get('isBedrock', False) else 1,     # Bedrock sprites first
+                            -item[0][1]  # Reverse Y for proper sprite layering (higher tiles on top)
+                        ))
                     
-                    # Render blocks in correct order
+                    # Render blocks in correct order. Plain tile-sized sprites
+                    # are batched through one C-level blits() call; the batch is
+                    # flushed whenever an order-sensitive block (tiled, stateful,
+                    # multi-tile or bordered) interleaves, so layering is kept.
+                    tile_size = self.tile_size
+                    show_borders = self.show_borders
+                    get_sprite = self.block_manager.get_sprite
+                    get_converted = self.tile_renderer.get_converted_sprite
+                    batch = []
                     for (x, y), block_data in sorted_blocks:
-                        screen_x = x * self.tile_size
-                        screen_y = y * self.tile_size
-                        
+                        screen_x = x * tile_size
+                        screen_y = y * tile_size
+
+                        if not show_borders and block_data.get('tileMode', 'standard') == 'standard':
+                            sprite = get_sprite(block_data.get('id', ''))
+                            if (sprite is not None and
+                                sprite.get_width() == tile_size and
+                                sprite.get_height() == tile_size):
+                                batch.append((get_converted(sprite), (screen_x, screen_y)))
+                                continue
+
+                        if batch:
+                            export_surface.blits(batch, doreturn=False)
+                            batch = []
+
                         self.tile_renderer.draw_block_optimized(
                             export_surface, self, x, y, block_data,
-                            screen_x, screen_y, self.tile_size, layer_enum
+                            screen_x, screen_y, tile_size, layer_enum
                         )
+
+                    if batch:
+                        export_surface.blits(batch, doreturn=False)
                 
                 pygame.image.save(export_surface, file_path)
                 print(f"World exported to {file_path}")
@@ -2208,7 +2869,7 @@ class OptimizedWorldPlanner:
         }
         self.place_bedrock()
         self.chunk_manager.invalidate_all_chunks()
-        self.init_ui()
+        self._schedule_ui_rebuild()
         self.invalidate_brush_cache()
 
     def open_sprite_dialog(self):
@@ -2229,7 +2890,7 @@ class OptimizedWorldPlanner:
                     self.block_manager.load_sprite_file(file_path)
                 
                 self.block_manager.update_custom_blocks()
-                self.init_ui()
+                self._schedule_ui_rebuild()
         except Exception as e:
             print(f"Error uploading sprites: {e}")
 
@@ -2248,7 +2909,8 @@ class OptimizedWorldPlanner:
     def select_block(self, block):
         """Select a block for placement with optimizations"""
         self.selected_block = block
-        
+        self._hover_preview_cache = None
+
         # Auto-switch back from paste tool to previous tool when selecting new sprite
         if self.active_tool == Tool.PASTE:
             self.active_tool = self.previous_tool
@@ -2269,68 +2931,94 @@ class OptimizedWorldPlanner:
             for btn in btns:
                 btn['selected'] = (btn['block'] == block)
         
-        if block not in self.recent_blocks:
-            self.recent_blocks.insert(0, block)
-            if len(self.recent_blocks) > 12:
-                self.recent_blocks.pop()
-        else:
-            self.recent_blocks.remove(block)
-            self.recent_blocks.insert(0, block)
+        if block:
+            block_id = block['id']
+            self._recent_ids.pop(block_id, None)
+            self._recent_ids[block_id] = block
+            while len(self._recent_ids) > 12:
+                self._recent_ids.popitem(last=False)
+            self.recent_blocks = list(reversed(self._recent_ids.values()))
         
-        self.init_ui()
+        self._schedule_ui_rebuild()
 
     def calculate_sprite_grid_size(self, block):
         """Calculate the grid size for placing sprites efficiently"""
-        sprite = self.block_manager.get_sprite(block['id'])
+        return self._sprite_geometry(block['id'], block.get('tileMode', 'standard'),
+                                     self.block_manager.blocks_version)[:2]
+
+    @lru_cache(maxsize=256)
+    def _sprite_geometry(self, block_id, tile_mode, blocks_version):
+        """Cached (grid_w, grid_h, offset_x, offset_y) sprite grid geometry"""
+        sprite = self.block_manager.get_sprite(block_id)
         if not sprite:
-            return (1, 1)  # Default to 1x1 grid
-        
-        tile_mode = block.get('tileMode', 'standard')
+            return (1, 1, 0, 0)  # Default to 1x1 grid
+
         bounds = self.tile_renderer.calculate_sprite_bounds(sprite, tile_mode)
-        
         if not bounds:
-            return (1, 1)
-        
-        # Calculate the maximum extents
-        min_x = min(dx for dx, dy in bounds)
-        max_x = max(dx for dx, dy in bounds)
-        min_y = min(dy for dx, dy in bounds)
-        max_y = max(dy for dx, dy in bounds)
-        
-        grid_width = max_x - min_x + 1
-        grid_height = max_y - min_y + 1
-        
-        return (grid_width, grid_height)
+            return (1, 1, 0, 0)
+
+        # Large sprites reduce over contiguous columns instead of tuples
+        if np is not None and len(bounds) >= 64:
+            arr = np.asarray(bounds, dtype=np.int32)
+            min_x, min_y = (int(v) for v in arr.min(0))
+            max_x, max_y = (int(v) for v in arr.max(0))
+        else:
+            # Single pass over the bounds instead of four min/max scans
+            min_x = max_x = bounds[0][0]
+            min_y = max_y = bounds[0][1]
+            for dx, dy in bounds:
+                if dx < min_x:
+                    min_x = dx
+                elif dx > max_x:
+                    max_x = dx
+                if dy < min_y:
+                    min_y = dy
+                elif dy > max_y:
+                    max_y = dy
+
+        return (max_x - min_x + 1, max_y - min_y + 1, -min_x, -min_y)
+
+    def _scrollbar_rects(self):
+        """Track and thumb rects, recomputed only when scroll geometry changes
+
+        Both getters are hit per mouse event and per frame; the cache key is
+        the full scroll geometry, so it self-invalidates on any scroll,
+        resize or toolbar-width change.
+        """
+        key = (self.toolbar_max_scroll, self.toolbar_scroll_y,
+               self.screen_height, self.toolbar_width)
+        if key != self._scrollbar_cache_key:
+            self._scrollbar_cache_key = key
+            if self.toolbar_max_scroll <= 0:
+                self._scrollbar_track = None
+                self._scrollbar_thumb = None
+            else:
+                scrollbar_x = self.toolbar_width - self.scrollbar_width - 2
+                track_rect = pygame.Rect(scrollbar_x, 40, self.scrollbar_width,
+                                         self.screen_height - 60)
+
+                visible_content_ratio = self.screen_height / (self.toolbar_max_scroll + self.screen_height)
+                thumb_height = max(20, int(track_rect.height * visible_content_ratio))
+
+                scroll_ratio = self.toolbar_scroll_y / self.toolbar_max_scroll
+                thumb_y = track_rect.y + int((track_rect.height - thumb_height) * scroll_ratio)
+
+                self._scrollbar_track = track_rect
+                self._scrollbar_thumb = pygame.Rect(track_rect.x, thumb_y,
+                                                    track_rect.width, thumb_height)
+        return self._scrollbar_track, self._scrollbar_thumb
 
     def get_scrollbar_rect(self):
         """Calculate scrollbar track rectangle"""
-        if self.toolbar_max_scroll <= 0:
-            return None
-        
-        scrollbar_x = self.toolbar_width - self.scrollbar_width - 2
-        scrollbar_y = 40
-        scrollbar_height = self.screen_height - 60
-        
-        return pygame.Rect(scrollbar_x, scrollbar_y, self.scrollbar_width, scrollbar_height)
+        return self._scrollbar_rects()[0]
 
     def get_scrollbar_thumb_rect(self):
         """Calculate scrollbar thumb rectangle"""
-        track_rect = self.get_scrollbar_rect()
-        if not track_rect or self.toolbar_max_scroll <= 0:
-            return None
-        
-        visible_content_ratio = self.screen_height / (self.toolbar_max_scroll + self.screen_height)
-        thumb_height = max(20, int(track_rect.height * visible_content_ratio))
-        
-        scroll_ratio = self.toolbar_scroll_y / self.toolbar_max_scroll
-        thumb_y = track_rect.y + int((track_rect.height - thumb_height) * scroll_ratio)
-        
-        return pygame.Rect(track_rect.x, thumb_y, track_rect.width, thumb_height)
+        return self._scrollbar_rects()[1]
 
     def handle_scrollbar_click(self, pos):
         """Handle clicks on the scrollbar"""
-        track_rect = self.get_scrollbar_rect()
-        thumb_rect = self.get_scrollbar_thumb_rect()
+        track_rect, thumb_rect = self._scrollbar_rects()
         
         if not track_rect or not thumb_rect:
             return False
@@ -2348,13 +3036,22 @@ class OptimizedWorldPlanner:
         
         return False
 
-    def handle_scrollbar_drag(self, pos):
+    def handle_scrollbar_drag(self, pos, force=False):
         """Handle dragging the scrollbar thumb"""
         if not self.is_dragging_scrollbar:
             return
-        
-        track_rect = self.get_scrollbar_rect()
-        thumb_rect = self.get_scrollbar_thumb_rect()
+
+        # Apply at most one scroll update per ~16ms; the latest position is
+        # kept and flushed on mouse-up so the thumb settles where the cursor
+        # stopped
+        now = pygame.time.get_ticks()
+        if not force and now - self._last_scrollbar_update_ms < 16:
+            self._pending_scrollbar_pos = pos
+            return
+        self._last_scrollbar_update_ms = now
+        self._pending_scrollbar_pos = None
+
+        track_rect, thumb_rect = self._scrollbar_rects()
         
         if not track_rect or not thumb_rect:
             return
@@ -2380,9 +3077,14 @@ class OptimizedWorldPlanner:
             return
 
         adjusted_pos = (pos[0], pos[1] + self.toolbar_scroll_y)
-        
-        for name, button_data in self.buttons.items():
-            if button_data['rect'].collidepoint(adjusted_pos):
+
+        # Below the last button there is nothing to hit
+        if adjusted_pos[1] >= self._toolbar_content_bottom:
+            return
+
+        for kind, payload in self._toolbar_hits_at(adjusted_pos):
+            if kind == 'button':
+                name, button_data = payload
                 if 'is_search' in button_data and button_data.get('is_search', False):
                     self.activate_search()
                 elif 'is_custom_input' in button_data and button_data.get('is_custom_input', False):
@@ -2393,29 +3095,23 @@ class OptimizedWorldPlanner:
                 elif 'block' in button_data:
                     self.select_block(button_data['block'])
                 return
-        
-        for tool, button_data in self.toolbuttons.items():
-            if button_data['rect'].collidepoint(adjusted_pos):
+            elif kind == 'tool':
+                tool, button_data = payload
                 previous_tool = self.active_tool
                 self.active_tool = tool
-                
+
                 if previous_tool != self.active_tool and self.active_tool != Tool.SELECT:
                     self.selection = None
                     self.selection_start = None
-                
+
                 for t, b in self.toolbuttons.items():
                     b['active'] = (t == tool)
-                self.init_ui()
+                self._schedule_ui_rebuild()
+                return
+            elif kind == 'block':
+                category, block_btn = payload
+                self.select_block(block_btn['block'])
                 return
-        
-        for category, blocks in self.block_buttons.items():
-            if not self.category_expanded.get(category, True):
-                continue
-            
-            for block_btn in blocks:
-                if block_btn['rect'].collidepoint(adjusted_pos):
-                    self.select_block(block_btn['block'])
-                    return
 
     def handle_toolbar_hover(self, mouse_pos):
         """Handle hover events for tooltips with optimizations"""
@@ -2423,68 +3119,86 @@ class OptimizedWorldPlanner:
             self.tooltip_manager.clear_tooltip()
             return
             
+        probe = (mouse_pos, self.toolbar_scroll_y, self._toolbar_layout_version)
+        if probe == self._last_hover_probe:
+            # Same cursor position over the same layout; skip the hit-testing
+            # but keep feeding the tooltip manager so its delay timer ticks
+            if self._last_hover_text:
+                self.tooltip_manager.set_tooltip(self._last_hover_text, mouse_pos)
+            else:
+                self.tooltip_manager.clear_tooltip()
+            return
+        self._last_hover_probe = probe
+
         adjusted_pos = (mouse_pos[0], mouse_pos[1] + self.toolbar_scroll_y)
+
+        # Below the last button there is nothing to hover
+        if adjusted_pos[1] >= self._toolbar_content_bottom:
+            self._last_hover_text = None
+            self.tooltip_manager.clear_tooltip()
+            return
+
         tooltip_text = None
-        
-        # Check for block button hovers
-        for category, blocks in self.block_buttons.items():
-            if not self.category_expanded.get(category, True):
-                continue
-                
-            for block_btn in blocks:
-                if block_btn['rect'].collidepoint(adjusted_pos):
-                    block = block_btn['block']
-                    tooltip_text = block.get('name', block.get('id', 'Unknown'))
-                    
-                    tile_mode = block.get('tileMode', 'standard')
-                    if tile_mode != 'standard':
-                        tooltip_text += f" ({tile_mode})"
-                    
-                    if 'state' in block:
-                        state = block.get('state', 0) + 1
-                        state_count = block.get('stateCount', 2)
-                        tooltip_text += f" [State {state}/{state_count}]"
-                    
-                    break
-        
-        if not tooltip_text:
-            for name, button_data in self.buttons.items():
-                if button_data['rect'].collidepoint(adjusted_pos):
-                    tooltip_map = {
-                        'toggle_grid': "Toggle grid display (G)",
-                        'toggle_borders': "Toggle block borders",
-                        'save': "Save world to file",
-                        'load': "Load world from file",
-                        'export': "Export world as image",
-                        'clear': "Clear entire world",
-                        'upload_sprite': "Upload custom sprite files",
-                        'search_bar': "Search blocks (Ctrl+F)",
-                        'undo': "Undo last action (Ctrl+Z)",
-                        'redo': "Redo last undone action (Ctrl+Y)",
-                        'bg_prev': "Previous background",
-                        'bg_next': "Next background",
-                        'bg_none': "No background",
-                        'brush_size_custom': "Custom brush size (type size and press Enter)"
-                    }
-                    
-                    if name in tooltip_map:
-                        tooltip_text = tooltip_map[name]
-                    elif name.startswith('brush_size_'):
-                        tooltip_text = f"Set brush size to {button_data['text']}"
-                    elif name in ['brush_square', 'brush_circle']:
-                        tooltip_text = f"Set brush shape to {button_data['text'].lower()}"
-                    break
-        
-        if not tooltip_text:
-            for tool, button_data in self.toolbuttons.items():
-                if button_data['rect'].collidepoint(adjusted_pos):
-                    tool_name = tool.name.capitalize()
-                    hotkey = self.get_tool_hotkey(tool)
-                    tooltip_text = f"{tool_name} Tool"
-                    if hotkey:
-                        tooltip_text += f" ({hotkey})"
-                    break
-        
+
+        # Bisect once, then keep the block > button > tool hover priority
+        block_hit = button_hit = tool_hit = None
+        for kind, payload in self._toolbar_hits_at(adjusted_pos):
+            if kind == 'block' and block_hit is None:
+                block_hit = payload
+            elif kind == 'button' and button_hit is None:
+                button_hit = payload
+            elif kind == 'tool' and tool_hit is None:
+                tool_hit = payload
+
+        if block_hit:
+            category, block_btn = block_hit
+            block = block_btn['block']
+            tooltip_text = block.get('name', block.get('id', 'Unknown'))
+
+            tile_mode = block.get('tileMode', 'standard')
+            if tile_mode != 'standard':
+                tooltip_text += f" ({tile_mode})"
+
+            if 'state' in block:
+                state = block.get('state', 0) + 1
+                state_count = block.get('stateCount', 2)
+                tooltip_text += f" [State {state}/{state_count}]"
+
+        if not tooltip_text and button_hit:
+            name, button_data = button_hit
+            tooltip_map = {
+                'toggle_grid': "Toggle grid display (G)",
+                'toggle_borders': "Toggle block borders",
+                'save': "Save world to file",
+                'load': "Load world from file",
+                'export': "Export world as image",
+                'clear': "Clear entire world",
+                'upload_sprite': "Upload custom sprite files",
+                'search_bar': "Search blocks (Ctrl+F)",
+                'undo': "Undo last action (Ctrl+Z)",
+                'redo': "Redo last undone action (Ctrl+Y)",
+                'bg_prev': "Previous background",
+                'bg_next': "Next background",
+                'bg_none': "No background",
+                'brush_size_custom': "Custom brush size (type size and press Enter)"
+            }
+
+            if name in tooltip_map:
+                tooltip_text = tooltip_map[name]
+            elif name.startswith('brush_size_'):
+                tooltip_text = f"Set brush size to {button_data['text']}"
+            elif name in ['brush_square', 'brush_circle']:
+                tooltip_text = f"Set brush shape to {button_data['text'].lower()}"
+
+        if not tooltip_text and tool_hit:
+            tool, button_data = tool_hit
+            tool_name = tool.name.capitalize()
+            hotkey = self.get_tool_hotkey(tool)
+            tooltip_text = f"{tool_name} Tool"
+            if hotkey:
+                tooltip_text += f" ({hotkey})"
+        
+        self._last_hover_text = tooltip_text
         if tooltip_text:
             self.tooltip_manager.set_tooltip(tooltip_text, mouse_pos)
         else:
@@ -2509,9 +3223,11 @@ class OptimizedWorldPlanner:
         
         # Clear canvas efficiently
         pygame.draw.rect(surface, (17, 17, 17), self.canvas_rect)
-        
-        # Draw world background first with advanced caching
-        self.draw_world_background_optimized(surface)
+
+        # Draw world background first with advanced caching; dropped while
+        # the predictor says the frame budget is already blown
+        if not self._degrade_overlays:
+            self.draw_world_background_optimized(surface)
         
         # Use consistent integer camera positions
         camera_x_int = int(round(self.camera_x))
@@ -2532,8 +3248,9 @@ class OptimizedWorldPlanner:
         if self.active_tool in [Tool.BRUSH, Tool.ERASE]:
             self.draw_brush_preview(surface)
         
-        self.draw_hover_indicator_optimized(surface, camera_x_int, camera_y_int, effective_tile_size)
-        
+        if not self._degrade_overlays:
+            self.draw_hover_indicator_optimized(surface, camera_x_int, camera_y_int, effective_tile_size)
+
         # Update performance stats
         self.performance_stats['render_time'] = pygame.time.get_ticks() - render_start_time
 
@@ -2562,61 +3279,45 @@ class OptimizedWorldPlanner:
             world_screen_y > self.screen_height):
             return
         
-        # Use advanced cached scaled background
+        # Hold the scaled background locally while its inputs are unchanged;
+        # even the cached lookup hashes keys and shuffles the LRU per frame
         target_size = (world_width_px, world_height_px)
-        scaled_bg = self.background_manager.get_current_background_cached(target_size)
+        bg_manager = self.background_manager
+        bg_key = (bg_manager.current_background, target_size, bg_manager.cache_version)
+        if bg_key == self._bg_scale_key:
+            scaled_bg = self._bg_scaled
+        else:
+            scaled_bg = bg_manager.get_current_background_cached(target_size)
+            if scaled_bg is not None:
+                self._bg_scale_key = bg_key
+                self._bg_scaled = scaled_bg
         
         if scaled_bg:
-            # Create optimized clipping area
-            canvas_clip = pygame.Rect(
-                self.toolbar_width + self.resize_handle_width, 0,
-                self.screen_width - self.toolbar_width - self.resize_handle_width,
-                self.screen_height
-            )
-            
-            # Optimized clipping and drawing
+            # canvas_rect is kept current on init/resize and is exactly the
+            # clip area, so no per-frame Rect construction is needed
             original_clip = surface.get_clip()
-            surface.set_clip(canvas_clip)
+            surface.set_clip(self.canvas_rect)
             surface.blit(scaled_bg, (world_screen_x, world_screen_y))
             surface.set_clip(original_clip)
 
     def draw_world_boundaries_optimized(self, surface, camera_x_int, camera_y_int, effective_tile_size):
         """Optimized world boundary drawing with batch operations"""
         boundary_color = (255, 0, 0, 128)
-        
-        # Batch boundary calculations
-        boundaries = []
-        
-        # Top boundary
-        top_y = -camera_y_int
-        if 0 <= top_y < self.screen_height:
-            boundaries.append(('horizontal', top_y))
-        
-        # Bottom boundary
-        bottom_y = self.world_height * effective_tile_size - camera_y_int
-        if 0 <= bottom_y < self.screen_height:
-            boundaries.append(('horizontal', bottom_y))
-        
-        # Left boundary
-        left_x = self.toolbar_width + self.resize_handle_width - camera_x_int
-        if self.toolbar_width + self.resize_handle_width <= left_x < self.screen_width:
-            boundaries.append(('vertical', left_x))
-        
-        # Right boundary
-        right_x = (self.world_width * effective_tile_size - camera_x_int + 
-                  self.toolbar_width + self.resize_handle_width)
-        if self.toolbar_width + self.resize_handle_width <= right_x < self.screen_width:
-            boundaries.append(('vertical', right_x))
-        
-        # Batch draw all boundaries
-        for boundary_type, pos in boundaries:
-            if boundary_type == 'horizontal':
-                pygame.draw.line(surface, boundary_color,
-                               (self.toolbar_width + self.resize_handle_width, pos),
-                               (self.screen_width, pos), 2)
-            else:  # vertical
-                pygame.draw.line(surface, boundary_color,
-                               (pos, 0), (pos, self.screen_height), 2)
+
+        world_rect = pygame.Rect(
+            self.toolbar_width + self.resize_handle_width - camera_x_int,
+            -camera_y_int,
+            self.world_width * effective_tile_size,
+            self.world_height * effective_tile_size
+        )
+
+        # One outlined rect replaces four per-edge line calls; the canvas
+        # clip keeps the outline off the toolbar
+        if world_rect.colliderect(self.canvas_rect):
+            original_clip = surface.get_clip()
+            surface.set_clip(self.canvas_rect)
+            pygame.draw.rect(surface, boundary_color, world_rect, 2)
+            surface.set_clip(original_clip)
 
     def draw_hover_indicator_optimized(self, surface, camera_x_int, camera_y_int, effective_tile_size):
         """Optimized hover indicator drawing with smart collision detection"""
@@ -2627,11 +3328,9 @@ class OptimizedWorldPlanner:
         if self.active_tool in [Tool.BRUSH, Tool.ERASE]:
             return  # Brush preview handles this
         
-        canvas_x = mouse_x - self.toolbar_width - self.resize_handle_width
-        
-        tile_x = int((canvas_x + camera_x_int) / effective_tile_size)
-        tile_y = int((mouse_y + camera_y_int) / effective_tile_size)
-        
+        tile_x, tile_y = self.screen_to_tile(mouse_x, mouse_y,
+                                             camera_x_int, camera_y_int, effective_tile_size)
+
         if not self.is_valid_position(tile_x, tile_y):
             return
         
@@ -2645,20 +3344,41 @@ class OptimizedWorldPlanner:
         elif self.active_tool == Tool.PLACE and self.selected_block:
             block_data = self.create_block_data_from_selected()
             if block_data:
-                sprite = self.block_manager.get_sprite(block_data.get('id', ''))
-                occupied_tiles = self.tile_renderer.get_sprite_occupied_tiles(tile_x, tile_y, block_data, sprite)
-                
-                has_collision = self.check_sprite_collision(tile_x, tile_y, block_data, self.active_layer)
+                # Interned block_data makes id() a stable identity key; the
+                # layer length folds most world edits into the key as well
+                cache_key = (tile_x, tile_y, id(block_data), self.active_layer,
+                             len(self.layers[self.active_layer]))
+                cached = self._hover_preview_cache
+                if cached and cached[0] == cache_key:
+                    occupied_tiles, has_collision = cached[1], cached[2]
+                else:
+                    sprite = self.block_manager.get_sprite(block_data.get('id', ''))
+                    occupied_tiles = self.tile_renderer.get_sprite_occupied_tiles(tile_x, tile_y, block_data, sprite)
+
+                    has_collision = self.check_sprite_collision(tile_x, tile_y, block_data, self.active_layer)
+                    self._hover_preview_cache = (cache_key, occupied_tiles, has_collision)
                 hover_color = (255, 100, 0) if has_collision else (0, 255, 0)
                 
-                # Optimized multi-tile preview drawing
+                # Batched multi-tile preview: bounds check and camera offset
+                # hoisted out of the loop, anchor outline drawn last at
+                # width 3, everything else in one tight width-2 loop
+                world_width = self.world_width
+                world_height = self.world_height
+                offset_x = self.toolbar_width + self.resize_handle_width - camera_x_int
+                draw_rect = pygame.draw.rect
+                anchor_rect = None
                 for occupied_x, occupied_y in occupied_tiles:
-                    if self.is_valid_position(occupied_x, occupied_y):
-                        preview_x = int(occupied_x * effective_tile_size) - camera_x_int + self.toolbar_width + self.resize_handle_width
-                        preview_y = int(occupied_y * effective_tile_size) - camera_y_int
-                        
-                        line_width = 3 if (occupied_x, occupied_y) == (tile_x, tile_y) else 2
-                        pygame.draw.rect(surface, hover_color, (preview_x, preview_y, effective_tile_size, effective_tile_size), line_width)
+                    if not (0 <= occupied_x < world_width and 0 <= occupied_y < world_height):
+                        continue
+                    tile_rect = (int(occupied_x * effective_tile_size) + offset_x,
+                                 int(occupied_y * effective_tile_size) - camera_y_int,
+                                 effective_tile_size, effective_tile_size)
+                    if occupied_x == tile_x and occupied_y == tile_y:
+                        anchor_rect = tile_rect
+                    else:
+                        draw_rect(surface, hover_color, tile_rect, 2)
+                if anchor_rect:
+                    draw_rect(surface, hover_color, anchor_rect, 3)
         else:
             hover_color = (255, 204, 0)
             pygame.draw.rect(surface, hover_color, (hover_x, hover_y, effective_tile_size, effective_tile_size), 2)
@@ -2709,11 +3429,10 @@ class OptimizedWorldPlanner:
         mouse_pos = pygame.mouse.get_pos()
         effective_tile_size = self.tile_size * self.zoom
 
-        start_x = int((self.selection_start[0] - self.toolbar_width - self.resize_handle_width + self.camera_x) / effective_tile_size)
-        start_y = int((self.selection_start[1] + self.camera_y) / effective_tile_size)
-
-        end_x = int((mouse_pos[0] - self.toolbar_width - self.resize_handle_width + self.camera_x) / effective_tile_size)
-        end_y = int((mouse_pos[1] + self.camera_y) / effective_tile_size)
+        start_x, start_y = self.screen_to_tile(self.selection_start[0], self.selection_start[1],
+                                               self.camera_x, self.camera_y, effective_tile_size)
+        end_x, end_y = self.screen_to_tile(mouse_pos[0], mouse_pos[1],
+                                           self.camera_x, self.camera_y, effective_tile_size)
 
         if start_x > end_x:
             start_x, end_x = end_x, start_x
@@ -2740,14 +3459,12 @@ class OptimizedWorldPlanner:
         effective_tile_size = self.tile_size * self.zoom
         
         # FIXED: Use exact same coordinate calculation as actual placement
-        canvas_x = mouse_pos[0] - self.toolbar_width - self.resize_handle_width
-        
         # Convert to integers first like in handle_mouse_click
         camera_x_int = int(round(self.camera_x))
         camera_y_int = int(round(self.camera_y))
-        
-        tile_x = int((canvas_x + self.camera_x) / effective_tile_size)
-        tile_y = int((mouse_pos[1] + self.camera_y) / effective_tile_size)
+
+        tile_x, tile_y = self.screen_to_tile(mouse_pos[0], mouse_pos[1],
+                                             self.camera_x, self.camera_y, effective_tile_size)
         
         if self.active_tool == Tool.BRUSH and self.selected_block:
             # Use optimized collision preview
@@ -2836,28 +3553,22 @@ class OptimizedWorldPlanner:
 
     def draw_buttons_optimized(self, surface, scroll_offset):
         """Optimized button drawing with frustum culling"""
+        searching_name = 'search_bar' if self.is_searching else None
+        inputting_name = 'brush_size_custom' if self.is_inputting_brush_size else None
         for name, button_data in self.buttons.items():
             # Frustum culling - skip if completely out of view
             if button_data['rect'].bottom + scroll_offset < 0 or button_data['rect'].top + scroll_offset > self.screen_height:
                 continue
 
-            adjusted_rect = button_data['rect'].copy()
-            adjusted_rect.y += scroll_offset
+            rect = button_data['rect']
+            adjusted_rect = self._scratch_rect
+            adjusted_rect.update(rect.x, rect.y + scroll_offset, rect.w, rect.h)
 
-            # Determine colors efficiently
-            is_disabled = not button_data.get('enabled', True)
-            if is_disabled:
-                button_color, text_color = (40, 40, 40), (128, 128, 128)
-            elif button_data.get('update_button', False):
-                button_color, text_color = (34, 139, 34), (255, 255, 255)  # Green for updates
-            elif name.startswith('category_'):
-                button_color, text_color = (85, 85, 85), (255, 255, 255)
-            elif button_data.get('active', False):
-                button_color, text_color = (0, 102, 204), (255, 255, 255)
-            elif (self.is_searching and name == 'search_bar') or (self.is_inputting_brush_size and name == 'brush_size_custom'):
-                button_color, text_color = (0, 120, 215), (255, 255, 255)
-            else:
-                button_color, text_color = (68, 68, 68), (255, 255, 255)
+            # Colors come from the state stamped at layout time
+            state = button_data['_color_state']
+            if state == 'default' and (name == searching_name or name == inputting_name):
+                state = 'searching'
+            button_color, text_color = self._BUTTON_COLOR_LUT[state]
 
             # Draw button
             pygame.draw.rect(surface, button_color, adjusted_rect)
@@ -2868,6 +3579,45 @@ class OptimizedWorldPlanner:
             elif 'text' in button_data:
                 self.draw_text_button_content(surface, button_data, adjusted_rect, text_color, name)
 
+    def _scaled_button_sprite(self, block_id, width, height):
+        """Scaled toolbar sprite from the LRU cache, rendering on miss"""
+        cache_key = (block_id, width, height)
+        cache = self.ui_surface_cache
+        scaled_sprite = cache.get(cache_key)
+        if scaled_sprite is not None:
+            cache.move_to_end(cache_key)
+            return scaled_sprite
+
+        sprite = self.block_manager.get_sprite(block_id)
+        if sprite is None:
+            return None
+
+        scaled_sprite = pygame.transform.scale(sprite, (width, height))
+        scaled_sprite = scaled_sprite.convert_alpha()
+        if len(cache) >= self._ui_sprite_cache_cap:
+            cache.popitem(last=False)
+        cache[cache_key] = scaled_sprite
+        return scaled_sprite
+
+    def _prewarm_button_sprites(self):
+        """Pre-scale sprites for the current layout so first paint never stalls"""
+        warmed = 0
+        for block_btn in self._visible_block_buttons:
+            rect = block_btn['rect']
+            self._scaled_button_sprite(block_btn['block']['id'],
+                                       rect.width - 8, rect.height - 8)
+            warmed += 1
+            if warmed >= self._ui_sprite_cache_cap:
+                return
+        for button_data in self.buttons.values():
+            block = button_data.get('block')
+            if block:
+                rect = button_data['rect']
+                self._scaled_button_sprite(block['id'], rect.width - 8, rect.height - 8)
+                warmed += 1
+                if warmed >= self._ui_sprite_cache_cap:
+                    return
+
     def draw_block_button_content(self, surface, button_data, rect):
         """Draw block button content with sprite caching"""
         block = button_data['block']
@@ -2877,26 +3627,11 @@ class OptimizedWorldPlanner:
         pygame.draw.rect(surface, border_color, rect, 2)
 
         # Draw block content
-        inner_rect = pygame.Rect(rect.x + 4, rect.y + 4, rect.width - 8, rect.height - 8)
+        inner_rect = self._scratch_inner
+        inner_rect.update(rect.x + 4, rect.y + 4, rect.width - 8, rect.height - 8)
 
-        sprite = self.block_manager.get_sprite(block['id'])
-        if sprite:
-            # Use sprite cache for scaled sprites
-            cache_key = (block['id'], inner_rect.width, inner_rect.height)
-            
-            if cache_key in self.ui_surface_cache:
-                scaled_sprite = self.ui_surface_cache[cache_key]
-            else:
-                scaled_sprite = pygame.transform.scale(sprite, (inner_rect.width, inner_rect.height))
-                scaled_sprite = scaled_sprite.convert_alpha()
-                
-                # Limit cache size
-                if len(self.ui_surface_cache) > 200:
-                    oldest_key = next(iter(self.ui_surface_cache))
-                    del self.ui_surface_cache[oldest_key]
-                
-                self.ui_surface_cache[cache_key] = scaled_sprite
-            
+        scaled_sprite = self._scaled_button_sprite(block['id'], inner_rect.width, inner_rect.height)
+        if scaled_sprite:
             surface.blit(scaled_sprite, inner_rect)
         else:
             pygame.draw.rect(surface, block['color'], inner_rect)
@@ -2917,16 +3652,20 @@ class OptimizedWorldPlanner:
         elif name == 'brush_size_custom' and self.is_inputting_brush_size:
             self.draw_brush_size_cursor(surface, text_x, text_y, text_rect, text_color)
 
+    def _text_width(self, text):
+        """Memoized text width; measuring beats re-rendering every frame"""
+        width = self._text_width_cache.get(text)
+        if width is None:
+            if len(self._text_width_cache) > 256:
+                self._text_width_cache.clear()
+            width = self.font.get_rect(text).width
+            self._text_width_cache[text] = width
+        return width
+
     def draw_search_cursor(self, surface, text_x, text_y, text_rect, text_color):
         """Draw search cursor with optimized positioning"""
-        prefix_text = "Search: "
-        prefix_surface, prefix_rect = self.font.render(prefix_text, text_color)
-        prefix_width = prefix_rect.width
-        
-        search_text_surface, search_rect = self.font.render(self.search_text[:self.search_cursor_pos], text_color)
-        search_text_width = search_rect.width
-
-        cursor_x = text_x + prefix_width + search_text_width
+        cursor_x = (text_x + self._text_width("Search: ")
+                    + self._text_width(self.search_text[:self.search_cursor_pos]))
         cursor_y = text_y
         cursor_height = text_rect.height
 
@@ -2937,14 +3676,8 @@ class OptimizedWorldPlanner:
 
     def draw_brush_size_cursor(self, surface, text_x, text_y, text_rect, text_color):
         """Draw custom brush size input cursor"""
-        prefix_text = "Custom: "
-        prefix_surface, prefix_rect = self.font.render(prefix_text, text_color)
-        prefix_width = prefix_rect.width
-        
-        brush_text_surface, brush_rect = self.font.render(self.custom_brush_text[:self.custom_brush_cursor_pos], text_color)
-        brush_text_width = brush_rect.width
-
-        cursor_x = text_x + prefix_width + brush_text_width
+        cursor_x = (text_x + self._text_width("Custom: ")
+                    + self._text_width(self.custom_brush_text[:self.custom_brush_cursor_pos]))
         cursor_y = text_y
         cursor_height = text_rect.height
 
@@ -2959,8 +3692,9 @@ class OptimizedWorldPlanner:
             if button_data['rect'].bottom + scroll_offset < 0 or button_data['rect'].top + scroll_offset > self.screen_height:
                 continue
 
-            adjusted_rect = button_data['rect'].copy()
-            adjusted_rect.y += scroll_offset
+            rect = button_data['rect']
+            adjusted_rect = self._scratch_rect
+            adjusted_rect.update(rect.x, rect.y + scroll_offset, rect.w, rect.h)
 
             button_color = (0, 102, 204) if button_data['active'] else (68, 68, 68)
             pygame.draw.rect(surface, button_color, adjusted_rect)
@@ -2973,46 +3707,30 @@ class OptimizedWorldPlanner:
 
     def draw_block_buttons_optimized(self, surface, scroll_offset):
         """Optimized block button drawing with batch operations"""
-        for category, blocks in self.block_buttons.items():
-            if not self.category_expanded.get(category, True):
+        for block_btn in self._visible_block_buttons:
+            if block_btn['rect'].bottom + scroll_offset < 0 or block_btn['rect'].top + scroll_offset > self.screen_height:
                 continue
 
-            for block_btn in blocks:
-                if block_btn['rect'].bottom + scroll_offset < 0 or block_btn['rect'].top + scroll_offset > self.screen_height:
-                    continue
+            block = block_btn['block']
+            rect = block_btn['rect']
+            adjusted_rect = self._scratch_rect
+            adjusted_rect.update(rect.x, rect.y + scroll_offset, rect.w, rect.h)
 
-                block = block_btn['block']
-                adjusted_rect = block_btn['rect'].copy()
-                adjusted_rect.y += scroll_offset
+            # Draw background and border
+            border_color = (255, 204, 0) if block_btn['selected'] else (102, 102, 102)
+            pygame.draw.rect(surface, (51, 51, 51), adjusted_rect)
+            pygame.draw.rect(surface, border_color, adjusted_rect, 2)
 
-                # Draw background and border
-                border_color = (255, 204, 0) if block_btn['selected'] else (102, 102, 102)
-                pygame.draw.rect(surface, (51, 51, 51), adjusted_rect)
-                pygame.draw.rect(surface, border_color, adjusted_rect, 2)
+            # Draw block content with caching
+            inner_rect = self._scratch_inner
+            inner_rect.update(adjusted_rect.x + 4, adjusted_rect.y + 4,
+                              adjusted_rect.width - 8, adjusted_rect.height - 8)
 
-                # Draw block content with caching
-                inner_rect = pygame.Rect(adjusted_rect.x + 4, adjusted_rect.y + 4, 
-                                       adjusted_rect.width - 8, adjusted_rect.height - 8)
-
-                sprite = self.block_manager.get_sprite(block['id'])
-                if sprite:
-                    cache_key = (block['id'], inner_rect.width, inner_rect.height)
-                    
-                    if cache_key in self.ui_surface_cache:
-                        scaled_sprite = self.ui_surface_cache[cache_key]
-                    else:
-                        scaled_sprite = pygame.transform.scale(sprite, (inner_rect.width, inner_rect.height))
-                        scaled_sprite = scaled_sprite.convert_alpha()
-                        
-                        if len(self.ui_surface_cache) > 200:
-                            oldest_key = next(iter(self.ui_surface_cache))
-                            del self.ui_surface_cache[oldest_key]
-                        
-                        self.ui_surface_cache[cache_key] = scaled_sprite
-                    
-                    surface.blit(scaled_sprite, inner_rect)
-                else:
-                    pygame.draw.rect(surface, block['color'], inner_rect)
+            scaled_sprite = self._scaled_button_sprite(block['id'], inner_rect.width, inner_rect.height)
+            if scaled_sprite:
+                surface.blit(scaled_sprite, inner_rect)
+            else:
+                pygame.draw.rect(surface, block['color'], inner_rect)
 
     def draw_scrollbar(self, surface):
         """Draw the scrollbar track and thumb with optimizations"""
@@ -3059,7 +3777,7 @@ class OptimizedWorldPlanner:
 
     def is_bedrock_position(self, y):
         """Check if position is in bedrock area"""
-        return y >= self.world_height - self.bedrock_rows
+        return y >= self._first_bedrock_y
 
     def handle_mouse_click(self, pos, button):
         """Handle mouse click events with optimizations"""
@@ -3086,11 +3804,11 @@ class OptimizedWorldPlanner:
                 self.is_inputting_brush_size = False
     
             # Convert to tile coordinates
-            effective_tile_size = self.tile_size * self.zoom
+            inv_tile_size = self._inv_effective_tile_size
             canvas_x = pos[0] - self.toolbar_width - self.resize_handle_width
-            
-            tile_x = int((canvas_x + self.camera_x) / effective_tile_size)
-            tile_y = int((pos[1] + self.camera_y) / effective_tile_size)
+
+            tile_x = int((canvas_x + self.camera_x) * inv_tile_size)
+            tile_y = int((pos[1] + self.camera_y) * inv_tile_size)
             
             # Handle right clicks - always enables panning
             if button == 3:
@@ -3106,100 +3824,117 @@ class OptimizedWorldPlanner:
                 pygame.event.set_grab(True)
                 return
     
-            # Handle left clicks for various tools
+            # Handle left clicks for various tools via the dispatch table
             if button == 1:
-                if self.active_tool == Tool.SELECT:
-                    if not self.is_valid_position(tile_x, tile_y):
-                        return
-                    self.selection_start = pos
-    
-                elif self.active_tool == Tool.PLACE and self.selected_block:
-                    if not self.is_valid_position(tile_x, tile_y):
-                        return
-                    if self.is_bedrock_position(tile_y):
-                        return
-    
-                    block_data = self.create_block_data_from_selected()
-                    if block_data:
-                        self.start_batch_operation(f"Place {block_data['id']}")
-                        if self.place_block(tile_x, tile_y, block_data):
-                            self.end_batch_operation()
-    
-                elif self.active_tool == Tool.BRUSH and self.selected_block:
-                    if not self.is_valid_position(tile_x, tile_y):
-                        return
-    
-                    block_data = self.create_block_data_from_selected()
-                    if block_data:
-                        self.start_batch_operation(f"Brush {block_data['id']}")
-                        self.place_blocks_with_brush(tile_x, tile_y, block_data)
-    
-                elif self.active_tool == Tool.ERASE:
-                    if not self.is_valid_position(tile_x, tile_y):
-                        return
-                    if self.is_bedrock_position(tile_y):
-                        return
-    
-                    if self.brush_size > 1:
-                        self.start_batch_operation("Erase with brush")
-                        self.erase_blocks_with_brush(tile_x, tile_y)
-                    else:
-                        if self.erase_block_at_position(tile_x, tile_y):
-                            self.save_state_for_undo("Erase block")
-                            # FIXED: Add immediate visual updates for single erase
-                            self.chunk_manager.force_update_affected_chunks([(tile_x, tile_y)])
-                            self.force_immediate_chunk_update()
-    
-                elif self.active_tool == Tool.FILL and self.selected_block:
-                    if not self.is_valid_position(tile_x, tile_y):
-                        return
-    
-                    target_block = self.layers[self.active_layer].get((tile_x, tile_y), None)
-                    block_data = self.create_block_data_from_selected()
-                    if block_data:
-                        self.start_batch_operation(f"Fill with {block_data['id']}")
-                        self.flood_fill(tile_x, tile_y, target_block, block_data)
-                        self.end_batch_operation()
-    
-                elif self.active_tool == Tool.PASTE:
-                    if not self.clipboard:
-                        print("Nothing to paste")
-                        return
-                    self.save_state_for_undo("Paste selection")
-                    self.paste_selection(tile_x, tile_y)
-    
-                elif self.active_tool == Tool.EYEDROPPER:
-                    if not self.is_valid_position(tile_x, tile_y):
-                        return
-                
-                    # Check active layer first, then other layer
-                    layers_to_check = [self.active_layer]
-                    other_layer = Layer.BACKGROUND if self.active_layer == Layer.MIDGROUND else Layer.MIDGROUND
-                    layers_to_check.append(other_layer)
-                    
-                    for layer_enum in layers_to_check:
-                        origin_pos, block_data = self.tile_renderer.find_sprite_at_position(self, tile_x, tile_y, layer_enum)
-                        if origin_pos is not None:
-                            block_id = block_data.get('id', '')
-                            block_def = self.block_manager.get_block_by_id(block_id)
-                            if block_def:
-                                self.select_block(block_def)
-                                self.active_layer = layer_enum
-                                self.init_ui()
-                                return
+                handler = self._left_click_handlers.get(self.active_tool)
+                if handler is not None:
+                    handler(tile_x, tile_y, pos)
+
+    def _click_select(self, tile_x, tile_y, pos):
+        """Left click with the select tool: anchor a new selection box"""
+        if not self.is_valid_position(tile_x, tile_y):
+            return
+        self.selection_start = pos
+
+    def _click_place(self, tile_x, tile_y, pos):
+        """Left click with the place tool: place the selected block"""
+        if not self.selected_block:
+            return
+        if not self.is_valid_position(tile_x, tile_y):
+            return
+        if self.is_bedrock_position(tile_y):
+            return
+
+        block_data = self.create_block_data_from_selected()
+        if block_data:
+            self.start_batch_operation(f"Place {block_data['id']}")
+            if self.place_block(tile_x, tile_y, block_data):
+                self.end_batch_operation()
+
+    def _click_brush(self, tile_x, tile_y, pos):
+        """Left click with the brush tool: start a brush stroke"""
+        if not self.selected_block:
+            return
+        if not self.is_valid_position(tile_x, tile_y):
+            return
+
+        block_data = self.create_block_data_from_selected()
+        if block_data:
+            self.start_batch_operation(f"Brush {block_data['id']}")
+            self.place_blocks_with_brush(tile_x, tile_y, block_data)
+
+    def _click_erase(self, tile_x, tile_y, pos):
+        """Left click with the erase tool: erase under the brush or cursor"""
+        if not self.is_valid_position(tile_x, tile_y):
+            return
+        if self.is_bedrock_position(tile_y):
+            return
+
+        if self.brush_size > 1:
+            self.start_batch_operation("Erase with brush")
+            self.erase_blocks_with_brush(tile_x, tile_y)
+        else:
+            if self.erase_block_at_position(tile_x, tile_y):
+                self.save_state_for_undo("Erase block")
+                # FIXED: Add immediate visual updates for single erase
+                self.chunk_manager.force_update_affected_chunks([(tile_x, tile_y)])
+                self.force_immediate_chunk_update()
+
+    def _click_fill(self, tile_x, tile_y, pos):
+        """Left click with the fill tool: flood fill from the clicked tile"""
+        if not self.selected_block:
+            return
+        if not self.is_valid_position(tile_x, tile_y):
+            return
+
+        target_block = self.layers[self.active_layer].get((tile_x, tile_y), None)
+        block_data = self.create_block_data_from_selected()
+        if block_data:
+            self.start_batch_operation(f"Fill with {block_data['id']}")
+            self.flood_fill(tile_x, tile_y, target_block, block_data)
+            self.end_batch_operation()
+
+    def _click_paste(self, tile_x, tile_y, pos):
+        """Left click with the paste tool: paste the clipboard"""
+        if not self.clipboard:
+            print("Nothing to paste")
+            return
+        self.save_state_for_undo("Paste selection")
+        self.paste_selection(tile_x, tile_y)
+
+    def _click_eyedropper(self, tile_x, tile_y, pos):
+        """Left click with the eyedropper: pick the block under the cursor"""
+        if not self.is_valid_position(tile_x, tile_y):
+            return
+
+        # Check active layer first, then other layer
+        layers_to_check = [self.active_layer]
+        other_layer = Layer.BACKGROUND if self.active_layer == Layer.MIDGROUND else Layer.MIDGROUND
+        layers_to_check.append(other_layer)
+
+        for layer_enum in layers_to_check:
+            origin_pos, block_data = self.tile_renderer.find_sprite_at_position(self, tile_x, tile_y, layer_enum)
+            if origin_pos is not None:
+                block_id = block_data.get('id', '')
+                block_def = self.block_manager.get_block_by_id(block_id)
+                if block_def:
+                    self.select_block(block_def)
+                    self.active_layer = layer_enum
+                    self._schedule_ui_rebuild()
+                    return
 
     def handle_selection(self, start_pos, end_pos):
         """Create a selection box from start to end position"""
         if not start_pos or not end_pos:
             return
 
-        effective_tile_size = self.tile_size * self.zoom
+        inv_tile_size = self._inv_effective_tile_size
 
-        start_x = int((start_pos[0] - self.toolbar_width - self.resize_handle_width + self.camera_x) / effective_tile_size)
-        start_y = int((start_pos[1] + self.camera_y) / effective_tile_size)
+        start_x = int((start_pos[0] - self.toolbar_width - self.resize_handle_width + self.camera_x) * inv_tile_size)
+        start_y = int((start_pos[1] + self.camera_y) * inv_tile_size)
 
-        end_x = int((end_pos[0] - self.toolbar_width - self.resize_handle_width + self.camera_x) / effective_tile_size)
-        end_y = int((end_pos[1] + self.camera_y) / effective_tile_size)
+        end_x = int((end_pos[0] - self.toolbar_width - self.resize_handle_width + self.camera_x) * inv_tile_size)
+        end_y = int((end_pos[1] + self.camera_y) * inv_tile_size)
 
         if start_x > end_x:
             start_x, end_x = end_x, start_x
@@ -3230,21 +3965,24 @@ class OptimizedWorldPlanner:
     
         total_copied = 0
     
+        # Walk the selection box with keyed lookups instead of scanning every
+        # placed block; selections are tiny compared to the world
         for layer_enum, layer_dict in self.layers.items():
-            for pos, block_data in layer_dict.items():
-                px, py = pos
-                if x <= px < x + width and y <= py < y + height:
-                    rel_x = px - x
-                    rel_y = py - y
-                    self.clipboard[layer_enum][(rel_x, rel_y)] = block_data.copy()
-                    total_copied += 1
+            clipboard_layer = self.clipboard[layer_enum]
+            layer_get = layer_dict.get
+            for py in range(y, y + height):
+                for px in range(x, x + width):
+                    block_data = layer_get((px, py))
+                    if block_data:
+                        clipboard_layer[(px - x, py - y)] = block_data
+                        total_copied += 1
     
         if total_copied > 0:
             # Store the current tool before switching to paste
             if self.active_tool in [Tool.PLACE, Tool.BRUSH]:
                 self.previous_tool = self.active_tool
             self.active_tool = Tool.PASTE
-            self.init_ui()
+            self._schedule_ui_rebuild()
 
     def flip_selection_horizontal(self):
         """Flip selection horizontally (mirror left-right) - accounts for multi-tile sprites"""
@@ -3261,9 +3999,13 @@ class OptimizedWorldPlanner:
         
         for layer_enum in [Layer.BACKGROUND, Layer.MIDGROUND]:
             layer = self.layers[layer_enum]
-            for pos, block_data in list(layer.items()):
-                px, py = pos
-                if x <= px < x + width and y <= py < y + height:
+            layer_get = layer.get
+            for py in range(y, y + height):
+                for px in range(x, x + width):
+                    block_data = layer_get((px, py))
+                    if block_data is None:
+                        continue
+                    pos = (px, py)
                     # Get sprite bounds to understand its footprint
                     sprite = self.block_manager.get_sprite(block_data.get('id', ''))
                     if sprite:
@@ -3325,14 +4067,17 @@ class OptimizedWorldPlanner:
         
         for layer_enum in [Layer.BACKGROUND, Layer.MIDGROUND]:
             layer = self.layers[layer_enum]
-            for pos, block_data in list(layer.items()):
-                px, py = pos
-                if x <= px < x + width and y <= py < y + height:
+            layer_get = layer.get
+            for py in range(y, y + height):
+                for px in range(x, x + width):
+                    block_data = layer_get((px, py))
+                    if block_data is None:
+                        continue
                     rel_x = px - x
                     rel_y = py - y
                     y_positions.append(rel_y)
-                    sprites_to_move.append((layer_enum, pos, block_data.copy(), rel_x, rel_y))
-                    positions_to_clear.append((layer_enum, pos))
+                    sprites_to_move.append((layer_enum, (px, py), block_data.copy(), rel_x, rel_y))
+                    positions_to_clear.append((layer_enum, (px, py)))
         
         if not sprites_to_move:
             return
@@ -3380,27 +4125,35 @@ class OptimizedWorldPlanner:
         max_rel_y = max(rel_y for rel_x, rel_y in all_positions)
         
         affected_positions = []
-        
-        for layer_enum, layer_dict in self.clipboard.items():
-            for rel_pos, block_data in layer_dict.items():
+        first_bedrock_y = self._first_bedrock_y
+
+        # Standard loop hoists: bind the per-tile attribute chains once
+        is_valid = self.is_valid_position
+        check_collision = self.tile_renderer.check_placement_collision
+        intern_block = self._intern_block
+        affected_append = affected_positions.append
+
+        for layer_enum, clipboard_dict in self.clipboard.items():
+            target_dict = self.layers[layer_enum]
+            for rel_pos, block_data in clipboard_dict.items():
                 rel_x, rel_y = rel_pos
                 # Place relative to bottom-left corner
                 world_x = target_x + (rel_x - min_rel_x)
                 world_y = target_y - (max_rel_y - rel_y)
-    
-                if (self.is_valid_position(world_x, world_y) and 
-                    not self.is_bedrock_position(world_y)):
-                    
+
+                if (is_valid(world_x, world_y) and
+                    world_y < first_bedrock_y):
+
                     # Check for collision before placing
-                    if not self.tile_renderer.check_placement_collision(self, world_x, world_y, block_data, layer_enum):
-                        self.layers[layer_enum][(world_x, world_y)] = block_data.copy()
-                        affected_positions.append((world_x, world_y))
+                    if not check_collision(self, world_x, world_y, block_data, layer_enum):
+                        target_dict[(world_x, world_y)] = intern_block(block_data)
+                        affected_append((world_x, world_y))
         
         # Clear selection after pasting
         if self.selection:
             self.selection = None
             self.selection_start = None
-            self.init_ui()
+            self._schedule_ui_rebuild()
         
         # Force immediate chunk updates for all affected positions
         if affected_positions:
@@ -3418,29 +4171,13 @@ class OptimizedWorldPlanner:
             if target_block.get('id', '') == replacement_block.get('id', ''):
                 return
     
-        # Calculate sprite dimensions once
+        # Sprite grid geometry comes from the per-(block, mode) memo, so
+        # repeated fills of the same block skip the bounds reduction
         if replacement_block is not None:
-            sprite = self.block_manager.get_sprite(replacement_block['id'])
-            if sprite:
-                tile_mode = replacement_block.get('tileMode', 'standard')
-                bounds = self.tile_renderer.calculate_sprite_bounds(sprite, tile_mode)
-                
-                if bounds:
-                    min_x = min(dx for dx, dy in bounds)
-                    max_x = max(dx for dx, dy in bounds)
-                    min_y = min(dy for dx, dy in bounds)
-                    max_y = max(dy for dx, dy in bounds)
-                    
-                    grid_width = max_x - min_x + 1
-                    grid_height = max_y - min_y + 1
-                    offset_x = -min_x
-                    offset_y = -min_y
-                else:
-                    grid_width, grid_height = 1, 1
-                    offset_x, offset_y = 0, 0
-            else:
-                grid_width, grid_height = 1, 1
-                offset_x, offset_y = 0, 0
+            grid_width, grid_height, offset_x, offset_y = self._sprite_geometry(
+                replacement_block['id'],
+                replacement_block.get('tileMode', 'standard'),
+                self.block_manager.blocks_version)
         else:
             grid_width, grid_height = 1, 1
             offset_x, offset_y = 0, 0
@@ -3451,59 +4188,121 @@ class OptimizedWorldPlanner:
         grid_origin_x = (world_min_x // grid_width) * grid_width
         grid_origin_y = (world_max_y // grid_height) * grid_height
     
-        print(f"Starting flood fill: sprite {grid_width}x{grid_height}")
+        log.debug("Starting flood fill: sprite %dx%d", grid_width, grid_height)
     
-        # STEP 1: Fast flood fill to find all matching tiles (no sprite placement yet)
+        # STEP 1: Scanline flood fill to find all matching tiles (no sprite
+        # placement yet). Whole horizontal runs are consumed per stack pop,
+        # so large open areas cost one pop per row segment instead of one
+        # per tile.
         matching_tiles = set()
+
+        world_width = self.world_width
+        bedrock_top = self._first_bedrock_y
+        layer_dict = self.layers[self.active_layer]
+        target_id = target_block.get('id', '') if target_block is not None else None
+        matching_add = matching_tiles.add
+
+        # Densify the match predicate up front: one pass over the placed
+        # blocks builds a flat byte mask indexed y * width + x, so the
+        # traversal below is pure byte indexing - no dict hashing and no
+        # per-cell id string comparison. The layer dict stays canonical;
+        # the mask is derived here and discarded, so it cannot drift.
+        grid_cells = world_width * bedrock_top
+        if target_id is None:
+            match = bytearray(b'\x01' * grid_cells)
+            for (bx, by) in layer_dict:
+                if by < bedrock_top:
+                    match[by * world_width + bx] = 0
+        else:
+            match = bytearray(grid_cells)
+            for (bx, by), block in layer_dict.items():
+                if by < bedrock_top and block.get('id', '') == target_id:
+                    match[by * world_width + bx] = 1
+
+        visited = bytearray(grid_cells)
         stack = [(start_x, start_y)]
-        visited = set()
-        
+        stack_append = stack.append
+
         while stack:
             x, y = stack.pop()
-            if (x, y) in visited:
-                continue
-    
-            if not self.is_valid_position(x, y) or self.is_bedrock_position(y):
+            row_base = y * world_width
+            if visited[row_base + x] or not match[row_base + x]:
                 continue
-    
-            visited.add((x, y))
-            current_block = self.layers[self.active_layer].get((x, y), None)
-    
-            # Check if matches target
-            matches_target = False
-            if target_block is None and current_block is None:
-                matches_target = True
-            elif (target_block is not None and current_block is not None and
-                target_block.get('id', '') == current_block.get('id', '')):
-                matches_target = True
-    
-            if matches_target:
-                matching_tiles.add((x, y))
-                
-                # Continue flood fill
-                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                    next_x, next_y = x + dx, y + dy
-                    if (next_x, next_y) not in visited:
-                        stack.append((next_x, next_y))
-    
-        print(f"Found {len(matching_tiles)} matching tiles")
-    
+
+            # Extend the run left and right along this row
+            left = x
+            while left > 0 and match[row_base + left - 1] and not visited[row_base + left - 1]:
+                left -= 1
+            right = x
+            while right + 1 < world_width and match[row_base + right + 1] and not visited[row_base + right + 1]:
+                right += 1
+
+            for run_x in range(left, right + 1):
+                visited[row_base + run_x] = 1
+                matching_add((run_x, y))
+
+            # Seed the rows above and below: walls never enter the stack,
+            # and only the first cell of each contiguous matching segment is
+            # pushed - the run extension on pop consumes the rest, keeping
+            # the stack a fraction of the fill size
+            if y > 0:
+                neighbor_base = row_base - world_width
+                ny = y - 1
+                segment_seeded = False
+                for run_x in range(left, right + 1):
+                    if visited[neighbor_base + run_x] or not match[neighbor_base + run_x]:
+                        segment_seeded = False
+                    elif not segment_seeded:
+                        stack_append((run_x, ny))
+                        segment_seeded = True
+            if y + 1 < bedrock_top:
+                neighbor_base = row_base + world_width
+                ny = y + 1
+                segment_seeded = False
+                for run_x in range(left, right + 1):
+                    if visited[neighbor_base + run_x] or not match[neighbor_base + run_x]:
+                        segment_seeded = False
+                    elif not segment_seeded:
+                        stack_append((run_x, ny))
+                        segment_seeded = True
+
+        log.debug("Found %d matching tiles", len(matching_tiles))
+
+        # No-op fill: nothing matched, so skip the placement/erase steps
+        # and the chunk invalidation entirely
+        if not matching_tiles:
+            return
+
         if replacement_block is not None:
-            # STEP 2: Calculate all valid grid positions (batch calculation)
+            # STEP 2: Calculate all valid grid positions (batch calculation).
+            # Common sprite grids (1, 2, 4 tiles) have power-of-two dims, so
+            # the floor-div-then-multiply snap collapses to one AND of the
+            # low bits; mixed or odd dims take the general formula. Masking
+            # matches floor division for negative offsets too, since Python
+            # ints use two's-complement semantics.
             grid_positions = set()
-            
-            for x, y in matching_tiles:
-                grid_x = ((x - grid_origin_x) // grid_width) * grid_width + grid_origin_x
-                grid_y = ((y - grid_origin_y) // grid_height) * grid_height + grid_origin_y
-                
-                sprite_x = grid_x + offset_x
-                sprite_y = grid_y + offset_y
-                
-                if (self.is_valid_position(sprite_x, sprite_y) and 
-                    not self.is_bedrock_position(sprite_y)):
-                    grid_positions.add((sprite_x, sprite_y))
+
+            if (grid_width & (grid_width - 1)) == 0 and (grid_height & (grid_height - 1)) == 0:
+                gw_mask = ~(grid_width - 1)
+                gh_mask = ~(grid_height - 1)
+                for x, y in matching_tiles:
+                    sprite_x = ((x - grid_origin_x) & gw_mask) + grid_origin_x + offset_x
+                    sprite_y = ((y - grid_origin_y) & gh_mask) + grid_origin_y + offset_y
+
+                    if 0 <= sprite_x < world_width and 0 <= sprite_y < bedrock_top:
+                        grid_positions.add((sprite_x, sprite_y))
+            else:
+                for x, y in matching_tiles:
+                    grid_x = ((x - grid_origin_x) // grid_width) * grid_width + grid_origin_x
+                    grid_y = ((y - grid_origin_y) // grid_height) * grid_height + grid_origin_y
+
+                    sprite_x = grid_x + offset_x
+                    sprite_y = grid_y + offset_y
+
+                    if 0 <= sprite_x < world_width and 0 <= sprite_y < bedrock_top:
+                        grid_positions.add((sprite_x, sprite_y))
     
-            print(f"Calculated {len(grid_positions)} sprite positions")
+            log.debug("Calculated %d sprite positions", len(grid_positions))
     
             # STEP 3: Batch collision checking (pre-filter invalid positions)
             valid_positions = []
@@ -3511,28 +4310,38 @@ class OptimizedWorldPlanner:
             
             for sprite_x, sprite_y in grid_positions:
                 # Only check if origin position is free and not in bedrock
-                if ((sprite_x, sprite_y) not in layer_dict and 
-                    not self.is_bedrock_position(sprite_y)):
+                if ((sprite_x, sprite_y) not in layer_dict and
+                    sprite_y < bedrock_top):
                     valid_positions.append((sprite_x, sprite_y))
                 
-            print(f"Validated {len(valid_positions)} positions for placement")
-    
-            # STEP 4: Batch placement (single operation)
-            block_copy = replacement_block.copy()
-            
-            # Disable chunk invalidation temporarily
-            old_invalidate = self.chunk_manager.invalidate_chunk
-            self.chunk_manager.invalidate_chunk = lambda x, y: None
-            
-            # Place all sprites in one batch
+            log.debug("Validated %d positions for placement", len(valid_positions))
+
+            # Every candidate collided: the fill changes nothing, so bail
+            # before interning and invalidation
+            if not valid_positions:
+                return
+
+            # STEP 4: Batch placement (single operation) - plain dict writes,
+            # so no invalidation fires mid-loop and no override hack is needed.
+            # Every filled tile aliases one interned dict instead of paying a
+            # ~500-byte allocation per tile.
+            shared_block = self._intern_block(replacement_block)
+            chunk_size = self.chunk_manager.chunk_size
+            touched_chunk_keys = set()
+
             for sprite_x, sprite_y in valid_positions:
-                self.layers[self.active_layer][(sprite_x, sprite_y)] = block_copy.copy()
-            
-            # Restore chunk invalidation
-            self.chunk_manager.invalidate_chunk = old_invalidate
-            
-            print(f"Placed {len(valid_positions)} sprites")
-            
+                layer_dict[(sprite_x, sprite_y)] = shared_block
+
+                # The sprite footprint spans its whole grid cell, so cover
+                # every chunk it overlaps, not just the origin's chunk
+                left = sprite_x - offset_x
+                top = sprite_y - offset_y
+                for cx in range(left // chunk_size, (left + grid_width - 1) // chunk_size + 1):
+                    for cy in range(top // chunk_size, (top + grid_height - 1) // chunk_size + 1):
+                        touched_chunk_keys.add((cx, cy))
+
+            log.debug("Placed %d sprites", len(valid_positions))
+
         else:
             # STEP 4: Batch erase mode - FIXED: Extra bedrock protection
             layer_dict = self.layers[self.active_layer]
@@ -3540,31 +4349,55 @@ class OptimizedWorldPlanner:
             
             for x, y in matching_tiles:
                 # FIXED: Double-check bedrock protection for erase mode
-                if (x, y) in layer_dict and not self.is_bedrock_position(y):
+                if (x, y) in layer_dict and y < bedrock_top:
                     positions_to_remove.append((x, y))
-            
+
+            # Nothing occupies the matched region, so there is nothing to
+            # erase and no chunk needs repainting
+            if not positions_to_remove:
+                return
+
             # Batch remove
+            chunk_size = self.chunk_manager.chunk_size
+            touched_chunk_keys = set()
             for pos in positions_to_remove:
                 del layer_dict[pos]
-            
-            print(f"Erased {len(positions_to_remove)} tiles")
-    
-        # STEP 5: Single chunk invalidation at the end
-        self.chunk_manager.invalidate_all_chunks()
-        print("Flood fill complete!")
+                touched_chunk_keys.add((pos[0] // chunk_size, pos[1] // chunk_size))
+
+            log.debug("Erased %d tiles", len(positions_to_remove))
+
+        # STEP 5: Invalidate only the chunks the fill actually touched
+        if touched_chunk_keys:
+            self._hover_preview_cache = None
+            self.chunk_manager.invalidate_chunk_keys(touched_chunk_keys)
+        log.debug("Flood fill complete")
     
     def flood_fill_async(self, start_x, start_y, target_block, replacement_block):
-        """Async version that doesn't freeze the UI (optional)"""
-        import threading
-        
-        def run_flood_fill():
-            self.flood_fill(start_x, start_y, target_block, replacement_block)
-            # Force a UI refresh after completion
-            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'flood_fill_complete': True}))
-        
-        thread = threading.Thread(target=run_flood_fill)
-        thread.daemon = True
-        thread.start()
+        """Async version that doesn't freeze the UI (optional)
+
+        Jobs go through one persistent worker thread instead of spawning a
+        fresh thread per call, so repeated fills can't interleave their
+        layer mutations and thread startup cost is paid once.
+        """
+        if self._flood_queue is None:
+            import queue
+            import threading
+
+            self._flood_queue = queue.Queue()
+
+            def flood_worker():
+                while True:
+                    job = self._flood_queue.get()
+                    try:
+                        self.flood_fill(*job)
+                        # Force a UI refresh after completion
+                        pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'flood_fill_complete': True}))
+                    finally:
+                        self._flood_queue.task_done()
+
+            threading.Thread(target=flood_worker, daemon=True).start()
+
+        self._flood_queue.put((start_x, start_y, target_block, replacement_block))
 
     def handle_key_press(self, key):
         """Handle keyboard shortcuts with optimizations"""
@@ -3661,7 +4494,7 @@ class OptimizedWorldPlanner:
         for t, b in self.toolbuttons.items():
             b['active'] = (t == self.active_tool)
 
-        self.init_ui()
+        self._schedule_ui_rebuild()
 
     def handle_search_input(self, key):
         """Handle keyboard input for the search bar"""
@@ -3678,7 +4511,7 @@ class OptimizedWorldPlanner:
             self.search_cursor_pos = min(len(self.search_text), self.search_cursor_pos + 1)
         elif key == pygame.K_RETURN or key == pygame.K_ESCAPE:
             self.is_searching = False
-            self.init_ui()
+            self._schedule_ui_rebuild()
         else:
             try:
                 if 32 <= key <= 126:
@@ -3691,7 +4524,7 @@ class OptimizedWorldPlanner:
         if 'search_bar' in self.buttons:
             self.buttons['search_bar']['text'] = f"Search: {self.search_text}"
 
-        self.init_ui()
+        self._schedule_ui_rebuild()
 
     def handle_brush_size_input(self, key):
         """Handle keyboard input for custom brush size"""
@@ -3715,10 +4548,10 @@ class OptimizedWorldPlanner:
             except ValueError:
                 pass  # Invalid input, ignore
             self.is_inputting_brush_size = False
-            self.init_ui()
+            self._schedule_ui_rebuild()
         elif key == pygame.K_ESCAPE:
             self.is_inputting_brush_size = False
-            self.init_ui()
+            self._schedule_ui_rebuild()
         else:
             # Only allow digits
             try:
@@ -3740,6 +4573,11 @@ class OptimizedWorldPlanner:
         if 'brush_size_custom' in self.buttons:
             self.buttons['brush_size_custom']['text'] = f"Custom: {self.custom_brush_text}"
 
+    def _cycle_selected_block_state(self, direction):
+        """Cycle the selected block's state; bound once for the state buttons"""
+        if self.selected_block:
+            self.cycle_block_state(self.selected_block, direction)
+
     def cycle_block_state(self, block, direction=1):
         """Cycle through available states for a multi-state block"""
         if 'state' in block and 'stateCount' in block:
@@ -3752,23 +4590,47 @@ class OptimizedWorldPlanner:
                 new_state = (current_state - 1) % state_count
             
             block['state'] = new_state
-            self.init_ui()
+            self._schedule_ui_rebuild()
+
+    def _chunk_keys_for_layer_diff(self, old_layers, new_layers):
+        """Chunk keys covering every position whose block differs between two layer snapshots.
+
+        Lets undo/redo repaint only the chunks an action actually changed
+        instead of invalidating the whole world.
+        """
+        chunk_size = self.chunk_manager.chunk_size
+        chunk_keys = set()
+
+        for layer in set(old_layers) | set(new_layers):
+            old_dict = old_layers.get(layer, {})
+            new_dict = new_layers.get(layer, {})
+            for pos in old_dict.keys() | new_dict.keys():
+                if old_dict.get(pos) != new_dict.get(pos):
+                    chunk_keys.add((pos[0] // chunk_size, pos[1] // chunk_size))
+
+        return chunk_keys
 
     def undo(self):
         """Undo last action"""
         restored_layers = self.undo_manager.undo()
         if restored_layers is not None:
+            changed_keys = self._chunk_keys_for_layer_diff(self.layers, restored_layers)
             self.layers = restored_layers
-            self.chunk_manager.invalidate_all_chunks()
-            self.init_ui()
+            if changed_keys:
+                self._hover_preview_cache = None
+                self.chunk_manager.invalidate_chunk_keys(changed_keys)
+            self._schedule_ui_rebuild()
 
     def redo(self):
         """Redo previously undone action"""
         restored_layers = self.undo_manager.redo()
         if restored_layers is not None:
+            changed_keys = self._chunk_keys_for_layer_diff(self.layers, restored_layers)
             self.layers = restored_layers
-            self.chunk_manager.invalidate_all_chunks()
-            self.init_ui()
+            if changed_keys:
+                self._hover_preview_cache = None
+                self.chunk_manager.invalidate_chunk_keys(changed_keys)
+            self._schedule_ui_rebuild()
 
     def handle_mouse_motion(self, pos):
         """Handle mouse motion with optimizations and coordinate tracking"""
@@ -3777,12 +4639,12 @@ class OptimizedWorldPlanner:
         
         # Efficient coordinate calculation for grid display
         if self.canvas_rect.collidepoint(pos):
-            effective_tile_size = self.tile_size * self.zoom
+            inv_tile_size = self._inv_effective_tile_size
             canvas_x = pos[0] - self.toolbar_width - self.resize_handle_width
-            
+
             # Convert to world grid coordinates
-            world_tile_x = int((canvas_x + self.camera_x) / effective_tile_size)
-            world_tile_y = int((pos[1] + self.camera_y) / effective_tile_size)
+            world_tile_x = int((canvas_x + self.camera_x) * inv_tile_size)
+            world_tile_y = int((pos[1] + self.camera_y) * inv_tile_size)
             
             # Convert to user coordinates (0,0 at bottom-left excluding bedrock)
             if self.is_valid_position(world_tile_x, world_tile_y):
@@ -3809,7 +4671,7 @@ class OptimizedWorldPlanner:
                 self.screen_height
             )
     
-            self.init_ui()
+            self._schedule_ui_rebuild()
             return
     
         if self.is_dragging:
@@ -3860,10 +4722,10 @@ class OptimizedWorldPlanner:
         # Handle brush painting while dragging
         if pygame.mouse.get_pressed()[0] and self.canvas_rect.collidepoint(pos):
             if self.active_tool in [Tool.BRUSH, Tool.ERASE]:
-                effective_tile_size = self.tile_size * self.zoom
+                inv_tile_size = self._inv_effective_tile_size
                 canvas_x = pos[0] - self.toolbar_width - self.resize_handle_width
-                tile_x = int((canvas_x + self.camera_x) / effective_tile_size)  # Ensure same as preview
-                tile_y = int((pos[1] + self.camera_y) / effective_tile_size)    # Ensure same as preview
+                tile_x = int((canvas_x + self.camera_x) * inv_tile_size)  # Ensure same as preview
+                tile_y = int((pos[1] + self.camera_y) * inv_tile_size)    # Ensure same as preview
     
                 if self.is_valid_position(tile_x, tile_y):
                     if self.active_tool == Tool.BRUSH and self.selected_block:
@@ -3921,6 +4783,9 @@ class OptimizedWorldPlanner:
         """Handle mouse button up events with optimizations"""
         if button == 1:
             if self.is_dragging_scrollbar:
+                # Flush the last throttled drag position before releasing
+                if self._pending_scrollbar_pos is not None:
+                    self.handle_scrollbar_drag(self._pending_scrollbar_pos, force=True)
                 self.is_dragging_scrollbar = False
                 return
                 
@@ -3963,7 +4828,7 @@ class OptimizedWorldPlanner:
                 canvas_x = mouse_pos[0] - self.toolbar_width - self.resize_handle_width
                 canvas_y = mouse_pos[1]
     
-                old_effective_tile_size = self.tile_size * self.zoom
+                old_effective_tile_size = self._effective_tile_size
                 world_x = (canvas_x + self.camera_x) / old_effective_tile_size
                 world_y = (canvas_y + self.camera_y) / old_effective_tile_size
     
@@ -3975,7 +4840,9 @@ class OptimizedWorldPlanner:
                     self.zoom = max(self.zoom - 0.125, 0.125)
     
                 if old_zoom != self.zoom:
-                    new_effective_tile_size = self.tile_size * self.zoom
+                    self._effective_tile_size = self.tile_size * self.zoom
+                    self._inv_effective_tile_size = 1.0 / self._effective_tile_size
+                    new_effective_tile_size = self._effective_tile_size
     
                     self.camera_x = world_x * new_effective_tile_size - canvas_x
                     self.camera_y = world_y * new_effective_tile_size - canvas_y
@@ -4016,10 +4883,46 @@ class OptimizedWorldPlanner:
         self.background_manager.clear_background_cache()
         self.ui_surface_cache.clear()
 
-        self.init_ui()
+        self._schedule_ui_rebuild()
         self.hotkey_help.mark_dirty()
         self.hotkey_help.update_help()
 
+    def screen_to_tile(self, screen_x, screen_y, camera_x, camera_y, effective_tile_size):
+        """Convert a screen position to world tile coordinates"""
+        return (int((screen_x - self.toolbar_width - self.resize_handle_width + camera_x) / effective_tile_size),
+                int((screen_y + camera_y) / effective_tile_size))
+
+    def _frame_signature(self):
+        """Compact signature of everything the rendered frame depends on.
+
+        Animated states (text-input cursors, dirty chunks, pending UI
+        rebuilds) are handled by the caller forcing a redraw; everything
+        else the draw path reads is captured here so an identical
+        signature means an identical frame.
+        """
+        tooltip = self.tooltip_manager
+        return (
+            self.camera_x, self.camera_y, self.zoom,
+            self.screen_width, self.screen_height,
+            self.toolbar_width, self.toolbar_scroll_y,
+            self.active_tool, self.active_layer,
+            id(self.selected_block),
+            self.selection, self.selection_start,
+            pygame.mouse.get_pos(),
+            self._toolbar_layout_version,
+            tooltip.current_tooltip, id(tooltip.tooltip_surface),
+            self.background_manager.current_background,
+            self.hotkey_help.visible,
+            self._degrade_overlays,
+            # Input cursors blink on a 500 ms phase; folding the phase into
+            # the signature redraws twice a second while typing is idle
+            # instead of every frame
+            self.is_searching, self.is_inputting_brush_size,
+            self.search_cursor_pos, self.custom_brush_cursor_pos,
+            ((pygame.time.get_ticks() // 500) & 1
+             if (self.is_searching or self.is_inputting_brush_size) else 0),
+        )
+
     def run_optimized(self):
         """Optimized main application loop with comprehensive performance monitoring"""
         print("🚀 Starting optimized main loop...")
@@ -4037,7 +4940,10 @@ class OptimizedWorldPlanner:
         
         while self.running:
             frame_start_time = pygame.time.get_ticks()
-            
+
+            # Drain any backgrounds that finished decoding on worker threads
+            self.background_manager.poll_background_loading()
+
             # Check for update status changes and refresh UI if needed
             if (self.update_manager and 
                 self.update_manager.check_complete and 
@@ -4045,7 +4951,7 @@ class OptimizedWorldPlanner:
                 self.last_update_state = self.update_manager.update_available
                 if self.update_manager.update_available:
                     print(f"🔄 Update detected, refreshing UI...")
-                    self.init_ui()
+                    self._schedule_ui_rebuild()
             
             # Handle events with batching
             events = pygame.event.get()
@@ -4071,7 +4977,18 @@ class OptimizedWorldPlanner:
                     self.handle_mouse_wheel(event)
                 elif event.type == pygame.VIDEORESIZE:
                     self.handle_window_resize(event)
-            
+                elif event.type == WORLD_LOADED_EVENT:
+                    self._apply_loaded_world(event.save_data, event.file_path)
+
+            # Coalesce scheduled UI rebuilds to at most one per ~16ms so fast
+            # typing in the search bar doesn't rebuild the toolbar per keystroke
+            if self._ui_rebuild_pending:
+                now = pygame.time.get_ticks()
+                if now - self._last_ui_build >= 16:
+                    self._ui_rebuild_pending = False
+                    self._last_ui_build = now
+                    self.init_ui()
+
             # Handle autosave timer
             if self.autosave_directory:
                 self.autosave_timer += self.clock.get_time()
@@ -4093,18 +5010,61 @@ class OptimizedWorldPlanner:
                 # Gradually increase chunk rendering when performance is good
                 self.chunk_manager.max_chunks_per_frame = min(5, self.chunk_manager.max_chunks_per_frame + 1)
                 self.performance_stats['adaptive_quality'] = min(1.0, self.performance_stats['adaptive_quality'] * 1.01)
-            
-            # Clear screen efficiently
-            self.screen.fill((17, 17, 17))
-            
-            # Render everything with optimizations
-            self.render_world_optimized(self.screen)
-            self.draw_toolbar(self.screen)
-            
-            # Draw UI overlays
-            self.tooltip_manager.draw(self.screen, self.screen_width, self.screen_height)
-            self.hotkey_help.draw(self.screen, self.screen_width, self.toolbar_width, self.resize_handle_width)
-            
+
+            # Gate background scale quality on the adaptive level: degrade to
+            # the fast SDL_SoftStretch scale under load, upgrade back to
+            # smoothscale when frame times recover
+            want_high_quality = self.performance_stats['adaptive_quality'] >= 0.7
+            if want_high_quality != self.background_manager.high_quality_bg:
+                self.background_manager.high_quality_bg = want_high_quality
+                # Drop cached scales so the next frame re-renders at the new quality
+                self.background_manager.scaled_background_cache.clear()
+                self.background_manager.cache_version += 1
+            
+            # Skip the whole draw pass when the frame would be identical to
+            # the last one; animated states always force a redraw
+            redraw = True
+            if (not self._ui_rebuild_pending
+                    and not any(chunk.dirty for chunk in self.chunk_manager.chunks.values())):
+                signature = self._frame_signature()
+                if signature == self._last_frame_signature and self._last_frame is not None:
+                    redraw = False
+                self._last_frame_signature = signature
+            else:
+                self._last_frame_signature = None
+
+            if redraw:
+                # Clear screen efficiently
+                self.screen.fill((17, 17, 17))
+
+                # Render everything with optimizations
+                self.render_world_optimized(self.screen)
+                self.draw_toolbar(self.screen)
+
+                # Draw UI overlays
+                self.tooltip_manager.draw(self.screen, self.screen_width, self.screen_height)
+                self.hotkey_help.draw(self.screen, self.screen_width, self.toolbar_width, self.resize_handle_width)
+
+                # Keep a copy for idle frames; flip() leaves the display
+                # surface contents undefined, so reblit from this instead
+                if (self._last_frame is None or
+                        self._last_frame.get_size() != (self.screen_width, self.screen_height)):
+                    self._last_frame = self.screen.copy()
+                else:
+                    self._last_frame.blit(self.screen, (0, 0))
+            else:
+                self.screen.blit(self._last_frame, (0, 0))
+
+            # Feed the pacing predictor with this frame's real work time and
+            # degrade optional overlays while the rolling prediction exceeds
+            # the 60 FPS budget, with hysteresis so it doesn't flap
+            self._frame_work_times.append(pygame.time.get_ticks() - frame_start_time)
+            self._predicted_frame_ms = sum(self._frame_work_times) / len(self._frame_work_times)
+            if self._degrade_overlays:
+                self._degrade_overlays = self._predicted_frame_ms > 12.0
+            else:
+                self._degrade_overlays = self._predicted_frame_ms > 15.0
+
             # Performance monitoring and stats
             self.frame_count += 1
             self.last_frame_time = current_time
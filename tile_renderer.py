@@ -2,6 +2,7 @@ import pygame
 import math
 import json
 import os
+from functools import lru_cache
 from constants import TileConnection
 
 
@@ -23,6 +24,11 @@ class OptimizedTileRenderer:
         
         # Pre-converted sprites for faster blitting
         self.converted_sprites = {}
+
+        # Largest sprite extent (in tiles) ever computed; bounds the origin
+        # probe window in find_sprite_at_position. Never shrinks.
+        self.max_bounds_w = 1
+        self.max_bounds_h = 1
     
     def get_converted_sprite(self, sprite):
         """Get a sprite converted to display format for faster blitting"""
@@ -57,6 +63,14 @@ class OptimizedTileRenderer:
         
         bounds = self._calculate_sprite_bounds_impl(sprite, tile_mode)
         self.sprite_cache[cache_key] = bounds
+
+        # Offsets are (dx >= 0, dy <= 0); widen the probe window if needed
+        for dx, dy in bounds:
+            if dx + 1 > self.max_bounds_w:
+                self.max_bounds_w = dx + 1
+            if 1 - dy > self.max_bounds_h:
+                self.max_bounds_h = 1 - dy
+
         return bounds
     
     def _calculate_sprite_bounds_impl(self, sprite, tile_mode):
@@ -1390,33 +1404,53 @@ class OptimizedTileRenderer:
             self.draw_standard_sprite_optimized(surface, sprite, screen_x, screen_y, size)
     
     # Include ALL the remaining methods from the original tile_renderer.py
+    @lru_cache(maxsize=512)
+    def _sprite_offsets(self, block_id, tile_mode, blocks_version):
+        """Memoized occupied-tile offsets; blocks_version keys out sprite reloads"""
+        sprite = self.block_manager.get_sprite(block_id)
+        return tuple(self.calculate_sprite_bounds(sprite, tile_mode))
+
     def get_sprite_occupied_tiles(self, tile_x, tile_y, block_data, sprite=None):
         """Get list of all tiles occupied by a sprite at given position"""
-        if sprite is None:
-            sprite = self.block_manager.get_sprite(block_data.get('id', ''))
-        
         tile_mode = block_data.get('tileMode', 'standard')
-        bounds = self.calculate_sprite_bounds(sprite, tile_mode)
-        
-        occupied_tiles = []
-        for dx, dy in bounds:
-            occupied_tiles.append((tile_x + dx, tile_y + dy))
-        
-        return occupied_tiles
+
+        # Offsets only depend on the block id and tile mode, so repeat calls
+        # are one memo lookup; callers pass the sprite they fetched for the
+        # same id, so the memo answers for that path too and the explicit
+        # bounds calculation only remains for id-less block data
+        block_id = block_data.get('id', '')
+        if sprite is None or block_id:
+            bounds = self._sprite_offsets(block_id, tile_mode,
+                                          self.block_manager.blocks_version)
+        else:
+            bounds = self.calculate_sprite_bounds(sprite, tile_mode)
+
+        return [(tile_x + dx, tile_y + dy) for dx, dy in bounds]
     
     def find_sprite_at_position(self, world_planner, target_x, target_y, layer):
-        """Find if there's a sprite occupying the target position and return its origin"""
+        """Find if there's a sprite occupying the target position and return its origin
+
+        Sprite offsets only extend right/up from the origin, so the owning
+        origin must lie in a small window left of and below the target. Probing
+        that window against the layer dict replaces the previous scan over
+        every placed block, turning the lookup from O(blocks) into O(1)-ish.
+        """
         layer_dict = world_planner.layers[layer]
-        
-        # Check all blocks in the layer
-        for (origin_x, origin_y), block_data in layer_dict.items():
-            sprite = self.block_manager.get_sprite(block_data.get('id', ''))
-            occupied_tiles = self.get_sprite_occupied_tiles(origin_x, origin_y, block_data, sprite)
-            
-            # Check if target position is in occupied tiles
-            if (target_x, target_y) in occupied_tiles:
-                return (origin_x, origin_y), block_data
-        
+        blocks_version = self.block_manager.blocks_version
+
+        for dx in range(self.max_bounds_w):
+            origin_x = target_x - dx
+            for dy in range(self.max_bounds_h):
+                origin = (origin_x, target_y + dy)
+                block_data = layer_dict.get(origin)
+                if block_data is None:
+                    continue
+                offsets = self._sprite_offsets(block_data.get('id', ''),
+                                               block_data.get('tileMode', 'standard'),
+                                               blocks_version)
+                if (dx, -dy) in offsets:
+                    return origin, block_data
+
         return None, None
     
     def check_placement_collision(self, world_planner, tile_x, tile_y, block_data, layer):